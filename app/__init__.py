@@ -1,6 +1,13 @@
-from flask import Flask
+import time
+from flask import Flask, g, request
 from flask_login import LoginManager
-from app.models import db, User
+from app.models import db, SETTINGS_CACHE
+from app.identity import USER_CACHE, load_identity
+from app.pages import PAGE_CACHE
+from app.database import configure_sqlite, engine_options
+from app.migrations import upgrade_database
+from app.diseases import configure_engine, reload_if_changed
+from app.metrics import METRICS, SampledProfiler
 from config import Config
 
 login_manager = LoginManager()
@@ -8,16 +15,67 @@ login_manager = LoginManager()
 def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config)
 
     db.init_app(app)
+    with app.app_context():
+        configure_sqlite(db.engine, app.config['SQLITE_PRAGMAS'])
     login_manager.init_app(app)
     login_manager.login_view = 'auth.login'
     login_manager.login_message = 'Connectez-vous pour accéder à cette page.'
     login_manager.login_message_category = 'info'
 
+    configure_engine(app.config['DIAGNOSTIC_ENGINE'],
+                     cache_size=app.config['RESULT_CACHE_SIZE'],
+                     cache_ttl=app.config['RESULT_CACHE_TTL'])
+    if app.config['DIAGNOSTIC_WORKERS'] > 0:
+        from app.executor import DiagnosticExecutor
+        app.extensions['diagnostic_executor'] = DiagnosticExecutor(
+            workers=app.config['DIAGNOSTIC_WORKERS'],
+            max_pending=app.config['DIAGNOSTIC_QUEUE_SIZE'],
+            timeout=app.config['DIAGNOSTIC_TIMEOUT'],
+            engine=app.config['DIAGNOSTIC_ENGINE'],
+            reload_interval=app.config['CATALOGUE_RELOAD_INTERVAL'])
+
+    if app.config['CONSULTATION_WRITE_BEHIND']:
+        from app.persistence import ConsultationWriter
+        app.extensions['consultation_writer'] = ConsultationWriter(
+            app,
+            batch_size=app.config['CONSULTATION_FLUSH_SIZE'],
+            interval=app.config['CONSULTATION_FLUSH_INTERVAL'],
+            max_pending=app.config['CONSULTATION_QUEUE_MAX'])
+
+    reload_interval = app.config['CATALOGUE_RELOAD_INTERVAL']
+    if reload_interval > 0:
+        @app.before_request
+        def check_catalogue():
+            reload_if_changed(reload_interval)
+
+    SETTINGS_CACHE.check_interval = app.config['SETTINGS_CHECK_INTERVAL']
+    USER_CACHE.configure(maxsize=app.config['USER_CACHE_SIZE'], ttl=app.config['USER_CACHE_TTL'])
+    PAGE_CACHE.configure(maxsize=app.config['PAGE_CACHE_SIZE'])
+    METRICS.enabled = app.config['METRICS_ENABLED']
+    profiler = None
+    if app.config['PROFILE_SAMPLE_RATE'] > 0:
+        profiler = SampledProfiler(app.config['PROFILE_SAMPLE_RATE'], app.config['PROFILE_DIR'])
+
+    @app.before_request
+    def start_request_timer():
+        g.request_start = time.perf_counter()
+        g.profile = profiler.start() if profiler else None
+
+    @app.teardown_request
+    def record_request(exc):
+        start = g.pop('request_start', None)
+        if start is not None and request.endpoint:
+            METRICS.observe(f'request:{request.endpoint}', (time.perf_counter() - start) * 1000)
+        profile = g.pop('profile', None)
+        if profile is not None:
+            profiler.stop(profile, request.endpoint or 'unknown')
+
     @login_manager.user_loader
     def load_user(user_id):
-        return User.query.get(int(user_id))
+        return load_identity(int(user_id))
 
     from app.routes.auth import auth_bp
     from app.routes.main import main_bp
@@ -27,18 +85,11 @@ def create_app():
     app.register_blueprint(main_bp)
     app.register_blueprint(admin_bp)
 
-    import json as _json
-
-    @app.template_filter('from_json')
-    def from_json_filter(s):
-        try:
-            return _json.loads(s)
-        except Exception:
-            return []
+    from app.commands import register_commands
+    register_commands(app)
 
     with app.app_context():
-        db.create_all()
-        _seed_admin()
+        upgrade_database(app, seed=_seed_admin)
 
     return app
 
@@ -0,0 +1,228 @@
+"""
+Catalogue des maladies — chargement depuis les fichiers de données.
+
+  app/data/diseases.jsonl : une maladie par ligne (objet JSON)
+  app/data/synonyms.json  : expressions courantes → termes du catalogue
+
+Seuls les champs utiles au score et aux listes restent en mémoire, dans des
+enregistrements compacts (__slots__, tuples de termes internés). Les champs
+d'affichage (symptômes, description, traitement, prévention) sont relus à
+la demande depuis le fichier grâce à la position de chaque ligne, et gardés
+dans un cache LRU borné.
+"""
+
+import bisect
+import itertools
+import json
+import os
+import re
+import sys
+import unicodedata
+from collections.abc import Mapping
+
+from app.cache import LRUCache
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+DISEASES_FILE = os.path.join(DATA_DIR, 'diseases.jsonl')
+SYNONYMS_FILE = os.path.join(DATA_DIR, 'synonyms.json')
+
+# Chaque maladie contient :
+#   - keywords       : mots-clés de détection (simple)
+#   - key_symptoms   : symptômes-clés TRÈS spécifiques (poids fort x3)
+#   - common_symptoms: symptômes fréquents mais non spécifiques (poids x1)
+#   - excludes       : termes qui réduisent le score (peu probable si présent)
+FIELDS = ("id", "name", "keywords", "key_symptoms", "common_symptoms", "excludes",
+          "symptoms", "description", "treatment", "prevention", "severity", "color")
+TERM_FIELDS = ("keywords", "key_symptoms", "common_symptoms", "excludes")
+DETAIL_FIELDS = ("symptoms", "description", "treatment", "prevention")
+
+# (fichier, id) → champs d'affichage
+DETAILS_CACHE = LRUCache(maxsize=128)
+
+
+class Disease(Mapping):
+    """
+    Maladie du catalogue. Se lit comme un dict (disease["keywords"],
+    {**disease}) ou par attribut dans les templates ; les champs
+    d'affichage sont chargés au premier accès.
+    """
+
+    __slots__ = ("id", "name", "slug", "keywords", "key_symptoms", "common_symptoms",
+                 "excludes", "severity", "color", "search_words", "_path", "_offset", "_stamp")
+
+    def __init__(self, data: dict, path: str, offset: int, stamp: tuple = None):
+        self.id = data["id"]
+        self.name = data["name"]
+        self.slug = slugify(self.name)
+        for field in TERM_FIELDS:
+            setattr(self, field, tuple(sys.intern(t) for t in data.get(field, [])))
+        self.severity = sys.intern(data.get("severity", ""))
+        self.color = sys.intern(data.get("color", ""))
+        # Mots du nom et de la description, pour la recherche de l'encyclopédie
+        self.search_words = frozenset(words(f"{self.name} {data.get('description', '')}"))
+        self._path = path
+        self._offset = offset
+        self._stamp = stamp  # (mtime, taille) du fichier d'où vient `offset`
+
+    def __getitem__(self, key):
+        if key in DETAIL_FIELDS:
+            return self.details()[key]
+        if key in FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __len__(self):
+        return len(FIELDS)
+
+    def __repr__(self):
+        return f"<Disease {self.id} {self.name!r}>"
+
+    def details(self) -> dict:
+        key = (self._path, self.id)
+        details = DETAILS_CACHE.get(key)
+        if details is None:
+            details = _read_details(self)
+            DETAILS_CACHE.set(key, details)
+        return details
+
+
+def _file_stamp(path: str) -> tuple:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_details(disease: Disease) -> dict:
+    with open(disease._path, 'rb') as f:
+        data = {}
+        # Position valable seulement si le fichier n'a pas changé depuis le
+        # chargement (avant le prochain rechargement du catalogue)
+        if disease._stamp is not None and _file_stamp(disease._path) == disease._stamp:
+            f.seek(disease._offset)
+            try:
+                data = json.loads(f.readline() or b"{}")
+            except ValueError:
+                data = {}
+        if data.get("id") != disease.id:
+            # Fichier modifié : rechercher la ligne par id
+            f.seek(0)
+            data = {}
+            for line in f:
+                try:
+                    candidate = json.loads(line) if line.strip() else {}
+                except ValueError:
+                    continue  # ligne en cours d'édition
+                if candidate.get("id") == disease.id:
+                    data = candidate
+                    break
+    # Tuples : les détails en cache sont partagés par les résultats et les pages
+    return {field: data.get(field, "") if field == "description" else tuple(data.get(field, []))
+            for field in DETAIL_FIELDS}
+
+
+def words(text: str) -> list:
+    """Mots (lettres et chiffres) d'un texte, en minuscules."""
+    return re.findall(r"\w+", text.lower())
+
+
+def slugify(text: str) -> str:
+    """"Grippe (Influenza)" → "grippe-influenza"."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def load_diseases(path: str = DISEASES_FILE) -> list:
+    diseases = []
+    slugs = set()
+    offset = 0
+    stamp = _file_stamp(path)
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                disease = Disease(json.loads(line), path, offset, stamp)
+                if disease.slug in slugs:
+                    disease.slug = f"{disease.slug}-{disease.id}"
+                slugs.add(disease.slug)
+                diseases.append(disease)
+            offset += len(line)
+    return diseases
+
+
+def load_synonyms(path: str = SYNONYMS_FILE) -> dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def data_version() -> tuple:
+    """(date de modification, taille) des fichiers de données."""
+    version = []
+    for path in (DISEASES_FILE, SYNONYMS_FILE):
+        stat = os.stat(path)
+        version.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(version)
+
+
+_versions = itertools.count(1)
+
+
+class CatalogueIndex:
+    """
+    Accès au catalogue sans parcours de liste : par id, par slug, par
+    gravité, par couleur et par mot de symptôme. Reconstruit à chaque
+    rechargement ; `version` change à chaque reconstruction.
+    """
+
+    def __init__(self, diseases: list):
+        self.version = next(_versions)
+        self.diseases = list(diseases)
+        self.by_id = {}
+        self.by_slug = {}
+        self.by_severity = {}  # gravité → maladies, dans l'ordre du catalogue
+        self.by_color = {}
+        self.by_word = {}      # mot du nom, de la description ou d'un terme → ids des maladies
+        for disease in self.diseases:
+            self.by_id[disease.id] = disease
+            self.by_slug[disease.slug] = disease
+            self.by_severity.setdefault(disease.severity, []).append(disease)
+            self.by_color.setdefault(disease.color, []).append(disease)
+            for word in disease.search_words:
+                self.by_word.setdefault(word, set()).add(disease.id)
+            for field in ("keywords", "key_symptoms", "common_symptoms"):
+                for term in getattr(disease, field):
+                    for word in words(term):
+                        self.by_word.setdefault(word, set()).add(disease.id)
+        self.sorted_words = sorted(self.by_word)
+        self.severity_counts = {sev: len(items) for sev, items in self.by_severity.items()}
+
+    def prefixed(self, prefix: str) -> set:
+        """Ids des maladies ayant un mot indexé commençant par `prefix`."""
+        ids = set()
+        i = bisect.bisect_left(self.sorted_words, prefix)
+        while i < len(self.sorted_words) and self.sorted_words[i].startswith(prefix):
+            ids |= self.by_word[self.sorted_words[i]]
+            i += 1
+        return ids
+
+    def matching(self, query: str) -> set:
+        """Ids des maladies ayant, pour chaque mot de `query`, un mot indexé qui commence par lui."""
+        ids = None
+        for word in words(query):
+            matches = self.prefixed(word)
+            ids = matches if ids is None else ids & matches
+        return ids
+
+    def filter(self, severity: str = None, symptom: str = None, text: str = None) -> list:
+        """
+        Maladies d'une gravité et/ou trouvées par la recherche : nom,
+        description ou symptômes (« fièv », « influenza »). `text` est la
+        saisie brute et `symptom` sa forme normalisée (synonymes) ; une
+        maladie trouvée par l'une ou l'autre est retenue.
+        """
+        items = self.by_severity.get(severity, []) if severity else self.diseases
+        found = [ids for ids in (self.matching(q) for q in (symptom, text) if q) if ids is not None]
+        if found:
+            ids = set().union(*found)
+            items = [d for d in items if d.id in ids]
+        return items
@@ -0,0 +1,26 @@
+"""
+Commandes d'exploitation : `flask --app run <commande>`, à planifier en cron.
+"""
+
+import click
+
+from app.models import db, Statistic, User
+
+
+def register_commands(app):
+    @app.cli.command('reconcile-stats')
+    def reconcile_stats():
+        """Recalcule les compteurs du tableau de bord admin."""
+        drift = Statistic.reconcile()
+        if drift:
+            for name, delta in sorted(drift.items()):
+                click.echo(f'{name} : écart de {delta:+d} corrigé')
+        else:
+            click.echo('Compteurs à jour.')
+
+    @app.cli.command('expire-subscriptions')
+    def expire_subscriptions():
+        """Rétrograde en gratuit les abonnements premium expirés."""
+        count = User.expire_subscriptions()
+        db.session.commit()
+        click.echo(f'{count} abonnement(s) expiré(s) rétrogradé(s).')
@@ -0,0 +1,47 @@
+"""
+Profil de la base SQLite partagée par les workers gunicorn.
+
+Avec la journalisation par défaut (rollback journal), un écrivain bloque
+tous les lecteurs le temps de son commit. Chaque connexion reçoit donc
+les PRAGMA de SQLITE_PRAGMAS :
+  - journal_mode=WAL     : les lectures ne bloquent plus les écritures
+  - synchronous=NORMAL   : pas de fsync à chaque commit en WAL (sûr en cas
+                           de crash applicatif, seule une coupure de courant
+                           peut perdre les dernières transactions)
+  - busy_timeout         : attente (ms) d'un verrou au lieu d'échouer
+                           immédiatement avec « database is locked »
+  - mmap_size, cache_size: lectures servies en mémoire
+Le pool SQLAlchemy est dimensionné par DB_POOL_SIZE (une connexion par
+thread de requête, plus le thread d'écriture différée).
+"""
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+
+def engine_options(config) -> dict:
+    """SQLALCHEMY_ENGINE_OPTIONS pour l'URI configurée."""
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        # Base en mémoire : une seule connexion partagée, pas de pool à dimensionner
+        return {}
+    return {
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_MAX_OVERFLOW'],
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+        'pool_pre_ping': url.get_backend_name() != 'sqlite',
+    }
+
+
+def configure_sqlite(engine, pragmas: dict):
+    """Applique `pragmas` à chaque nouvelle connexion SQLite de `engine`."""
+    if engine.dialect.name != 'sqlite':
+        return
+    statements = [f'PRAGMA {name}={value}' for name, value in pragmas.items() if value not in (None, '')]
+
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, _record):
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
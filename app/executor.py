@@ -0,0 +1,142 @@
+"""
+Exécuteur de diagnostic en pool de processus — optionnel.
+
+Le score est du calcul Python pur : dans un worker gunicorn à plusieurs
+threads, les consultations se disputent le GIL et une requête lourde
+(beaucoup de recherches floues) bloque les autres. L'exécuteur délègue
+le score à un pool persistant de processus dont chacun a construit
+l'index des maladies au démarrage.
+
+  - file bornée : au-delà de `max_pending` requêtes en cours, le score
+    est fait dans le thread appelant
+  - délai par requête : passé `timeout` secondes, on abandonne l'attente
+    et on score dans le thread appelant
+  - pool cassé (processus tué) : score dans le thread appelant
+Chaque processus recharge le catalogue quand les fichiers de données
+changent, comme les workers.
+
+Le pool est démarré à la première consultation de chaque worker, jamais
+à la création de l'application : les processus « spawn » réimportent le
+module principal, et un `app = create_app()` au niveau module (run.py)
+y est réexécuté. Fonctionne sous gunicorn (`run:app`) et `flask run` ;
+avec `python run.py`, chaque processus du pool refait en plus ce
+create_app() à son démarrage.
+
+Activé par DIAGNOSTIC_WORKERS > 0 dans la configuration.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+from app import diseases
+
+
+_reload_interval = 0
+
+
+def _init_worker(engine: str, reload_interval: float):
+    # L'index est construit à l'import de app.diseases dans le processus fils ;
+    # le cache de résultats reste dans le processus parent.
+    global _reload_interval
+    _reload_interval = reload_interval
+    diseases.configure_engine(engine, cache_size=0)
+
+
+def _warm_up():
+    return diseases.DISEASE_INDEX is not None
+
+
+def _score(normalized: str, top_n: int) -> list:
+    if _reload_interval > 0:
+        diseases.reload_if_changed(_reload_interval)
+    return diseases.score_text(normalized, top_n)
+
+
+class DiagnosticExecutor:
+    """Pool de processus de score avec file bornée, délai et repli local."""
+
+    def __init__(self, workers: int, max_pending: int = 32, timeout: float = 5.0,
+                 engine: str = "python", reload_interval: float = 0):
+        self.workers = workers
+        self.timeout = timeout
+        self._engine = engine
+        self._reload_interval = reload_interval
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.fallbacks = 0
+        self.timeouts = 0
+        self._pool = None
+        self._pid = None
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        # Un pool hérité d'un fork (gunicorn --preload) n'est pas utilisable
+        with self._lock:
+            if self._pool is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._pool = self._start_pool()
+            return self._pool
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        # "spawn" : pas de fork d'un worker gunicorn déjà multi-threadé
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._engine, self._reload_interval),
+        )
+        for _ in range(self.workers):
+            pool.submit(_warm_up)
+        return pool
+
+    def score(self, normalized: str, top_n: int = 3) -> list:
+        """Même contrat que diseases.score_text."""
+        if not self._slots.acquire(blocking=False):
+            return self._inline(normalized, top_n)
+        try:
+            future = self._ensure_pool().submit(_score, normalized, top_n)
+        except (BrokenProcessPool, RuntimeError):
+            self._slots.release()
+            self._restart()
+            return self._inline(normalized, top_n)
+        # La place est rendue quand le processus a fini, même après un délai dépassé
+        future.add_done_callback(lambda _: self._slots.release())
+        with self._lock:
+            self.submitted += 1
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            future.cancel()
+            with self._lock:
+                self.timeouts += 1
+            return self._inline(normalized, top_n)
+        except BrokenProcessPool:
+            self._restart()
+            return self._inline(normalized, top_n)
+
+    def _inline(self, normalized: str, top_n: int) -> list:
+        with self._lock:
+            self.fallbacks += 1
+        return diseases.score_text(normalized, top_n)
+
+    def _restart(self):
+        with self._lock:
+            old, self._pool = self._pool, None
+        if old is not None and self._pid == os.getpid():
+            old.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        if self._pool is not None and self._pid == os.getpid():
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "submitted": self.submitted,
+                "fallbacks": self.fallbacks,
+                "timeouts": self.timeouts,
+            }
@@ -0,0 +1,93 @@
+"""
+Identité de l'utilisateur connecté, en cache entre les requêtes.
+
+Flask-Login appelle user_loader à chaque requête authentifiée : sans cache,
+chaque page (même /maladies ou /a-propos) coûte un SELECT sur users. On
+garde en mémoire du processus, pour USER_CACHE_TTL secondes, les colonnes
+dont la mise en page a besoin (nom, rôle, plan, expiration, quota).
+CachedUser se lit comme un User ; tout autre attribut ou méthode (email,
+check_password, consume_uses...) charge le vrai User au premier accès.
+
+Invalidation : au commit de toute transaction qui modifie un User par
+l'ORM (plan, mot de passe...) ou qui l'a signalé par mark_user_stale()
+(UPDATE direct, ex. consume_uses). Les autres workers gunicorn voient la
+modification au plus tard à l'expiration du TTL ; les vérifications de
+quota restent faites en base.
+"""
+
+from flask_login import UserMixin
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.cache import LRUCache
+from app.models import db, PlanMixin, User
+
+# Colonnes gardées en cache : celles lues par base.html et les pages du compte
+FIELDS = ('id', 'username', 'is_admin', 'plan', 'subscription_expires',
+          'monthly_uses', 'last_reset_date')
+
+USER_CACHE = LRUCache(maxsize=4096, ttl=30)
+
+
+class CachedUser(PlanMixin, UserMixin):
+    """Instantané d'un User ; charge le vrai User à la demande."""
+
+    def __init__(self, data: dict):
+        self._data = data
+        self._user = None
+
+    def __getattr__(self, name):
+        # Appelé seulement pour les attributs absents de la classe
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if self._user is None and name in self._data:
+            return self._data[name]
+        return getattr(self._load(), name)
+
+    def _load(self):
+        if self._user is None:
+            self._user = db.session.get(User, self._data['id'])
+            if self._user is None:
+                raise AttributeError('utilisateur supprimé')
+        return self._user
+
+    def __eq__(self, other):
+        return getattr(other, 'id', None) == self._data['id']
+
+    def __hash__(self):
+        return hash(self._data['id'])
+
+    def __repr__(self):
+        return f"<CachedUser {self._data['id']}>"
+
+
+def load_identity(user_id: int):
+    """user_loader de Flask-Login."""
+    data = USER_CACHE.get(user_id)
+    if data is None:
+        user = db.session.get(User, user_id)
+        if user is None:
+            return None
+        if not USER_CACHE.enabled:
+            return user
+        data = {field: getattr(user, field) for field in FIELDS}
+        USER_CACHE.set(user_id, data)
+    return CachedUser(data)
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_stale_users(session, _flush_context):
+    stale = [obj.id for obj in list(session.dirty) + list(session.deleted) if isinstance(obj, User)]
+    if stale:
+        session.info.setdefault('stale_users', set()).update(stale)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_stale_users(session):
+    for user_id in session.info.pop('stale_users', ()):
+        USER_CACHE.delete(user_id)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _forget_stale_users(session):
+    session.info.pop('stale_users', None)
@@ -0,0 +1,144 @@
+"""
+Mesures du pipeline de consultation, en mémoire du processus.
+
+Chaque étape (quota, normalisation, phases du score, commit, rendu) est
+enregistrée dans un histogramme à seaux fixes (millisecondes), exposé en
+JSON par /admin/metrics. Les phases du score mesurées dans un processus
+du pool de score restent dans ce processus : seule la durée totale du
+score est alors visible dans le worker.
+
+Profilage échantillonné : avec PROFILE_SAMPLE_RATE > 0, une fraction des
+requêtes est exécutée sous cProfile et le profil est écrit dans
+PROFILE_DIR (lisible avec `python -m pstats` ou snakeviz).
+"""
+
+import bisect
+import cProfile
+import itertools
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+# Bornes supérieures des seaux, en millisecondes (le dernier seau est +inf)
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class Histogram:
+    """Histogramme cumulatif à seaux fixes, au format des histogrammes Prometheus."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(BUCKETS_MS, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Estimation par la borne supérieure du seau contenant le quantile."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(BUCKETS_MS, self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def to_dict(self) -> dict:
+        cumulative = 0
+        buckets = {}
+        for bound, n in zip(BUCKETS_MS + ("+Inf",), self.counts):
+            cumulative += n
+            buckets[str(bound)] = cumulative
+        return {
+            "count": self.count,
+            "sum_ms": round(self.total, 3),
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class Metrics:
+    """Histogrammes par étape, partagés entre les threads d'un worker."""
+
+    def __init__(self):
+        self.enabled = True
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, ms: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = Histogram()
+            histogram.observe(ms)
+
+    @contextmanager
+    def timer(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, (time.perf_counter() - start) * 1000)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {stage: h.to_dict() for stage, h in sorted(self._histograms.items())}
+
+
+METRICS = Metrics()
+
+
+class SampledProfiler:
+    """
+    Profile une fraction `rate` des requêtes avec cProfile. Un seul profil à la
+    fois par processus : cProfile ne peut pas être actif dans deux
+    threads simultanément (Python ≥ 3.12).
+    """
+
+    def __init__(self, rate: float, directory: str):
+        self.rate = rate
+        self.directory = directory
+        self._busy = threading.Lock()
+        self._ids = itertools.count(1)
+        os.makedirs(directory, exist_ok=True)
+
+    def start(self):
+        """Retourne un profileur actif, ou None si la requête n'est pas échantillonnée."""
+        if random.random() >= self.rate or not self._busy.acquire(blocking=False):
+            return None
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Un autre outil de profilage est déjà actif
+            self._busy.release()
+            return None
+        return profiler
+
+    def stop(self, profiler: cProfile.Profile, name: str):
+        profiler.disable()
+        self._busy.release()
+        filename = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(self._ids)}-{name}.prof"
+        profiler.dump_stats(os.path.join(self.directory, filename))
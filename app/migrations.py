@@ -0,0 +1,152 @@
+"""
+Migrations du schéma, appliquées au démarrage après db.create_all().
+
+create_all() crée les tables manquantes mais ne modifie jamais une table
+existante (index, colonnes, données). Chaque migration est une fonction
+idempotente, exécutée une seule fois par base et enregistrée dans la
+table schema_migrations. Pour en ajouter une : écrire la fonction et
+l'ajouter à la fin de MIGRATIONS, sans jamais renommer les précédentes.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from app.models import db, Consultation, ConsultationResult, Statistic, SubscriptionRequest, User
+
+BACKFILL_CHUNK = 1000
+
+
+def add_consultation_user_created_index():
+    """Index (user_id, created_at) : historique, tableau de bord et compteurs par utilisateur."""
+    for index in Consultation.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+
+
+def backfill_consultation_results():
+    """Reprend les résumés JSON de Consultation.results dans consultation_results."""
+    from app.diseases import DISEASES
+    ids_by_name = {disease['name']: disease['id'] for disease in DISEASES}
+    last_id = 0
+    while True:
+        # Par tranches d'id ; les consultations déjà reprises sont ignorées
+        rows = db.session.query(Consultation.id, Consultation.results, Consultation.created_at)\
+            .filter(Consultation.id > last_id, Consultation.results.isnot(None),
+                    ~db.exists().where(ConsultationResult.consultation_id == Consultation.id))\
+            .order_by(Consultation.id).limit(BACKFILL_CHUNK).all()
+        if not rows:
+            return
+        diagnoses = []
+        for consultation_id, blob, created_at in rows:
+            try:
+                summary = json.loads(blob)
+            except ValueError:
+                continue
+            if not isinstance(summary, list):
+                continue
+            for rank, result in enumerate(summary, 1):
+                if isinstance(result, dict) and result.get('name'):
+                    diagnoses.append({
+                        'consultation_id': consultation_id,
+                        'rank': rank,
+                        'disease_id': ids_by_name.get(result['name']),
+                        'name': result['name'],
+                        'confidence': int(result.get('confidence') or 0),
+                        'score': None,
+                        'created_at': created_at,
+                    })
+        if diagnoses:
+            db.session.execute(db.insert(ConsultationResult), diagnoses)
+        db.session.commit()
+        last_id = rows[-1][0]
+
+
+def add_admin_list_indexes():
+    """Index des listes admin : utilisateurs par plan/inscription, demandes par statut/date et par utilisateur."""
+    for model in (User, SubscriptionRequest):
+        for index in model.__table__.indexes:
+            index.create(db.engine, checkfirst=True)
+    if db.engine.dialect.name == 'sqlite':
+        # Statistiques de l'optimiseur : sans elles, une recherche par nom
+        # parcourt l'index (is_admin, created_at) au lieu des index uniques
+        db.session.execute(db.text('ANALYZE'))
+
+
+def seed_statistics():
+    """Compteurs initiaux du tableau de bord admin."""
+    Statistic.reconcile()
+
+
+MIGRATIONS = [
+    ('0001_consultation_user_created_index', add_consultation_user_created_index),
+    ('0002_backfill_consultation_results', backfill_consultation_results),
+    ('0003_seed_statistics', seed_statistics),
+    ('0004_admin_list_indexes', add_admin_list_indexes),
+]
+
+
+class SchemaMigration(db.Model):
+    __tablename__ = 'schema_migrations'
+    name = db.Column(db.String(100), primary_key=True)
+    applied_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+def apply_migrations(logger=None) -> list:
+    """Applique les migrations manquantes, dans l'ordre ; retourne leurs noms."""
+    SchemaMigration.__table__.create(db.engine, checkfirst=True)
+    done = {name for (name,) in db.session.query(SchemaMigration.name)}
+    applied = []
+    for name, migrate in MIGRATIONS:
+        if name in done:
+            continue
+        migrate()
+        db.session.merge(SchemaMigration(name=name))
+        db.session.commit()
+        applied.append(name)
+        if logger:
+            logger.info('Migration appliquée : %s', name)
+    return applied
+
+
+@contextmanager
+def migration_lock(path: str):
+    """
+    Verrou exclusif inter-processus (fichier) : les workers gunicorn qui
+    démarrent ensemble créent les tables et appliquent les migrations
+    l'un après l'autre ; les suivants trouvent le travail déjà fait.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a+') as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def upgrade_database(app, seed=None) -> list:
+    """
+    Sous migration_lock : create_all(), migrations manquantes (relues dans
+    le verrou) puis `seed()`. Retourne les migrations appliquées.
+    """
+    with migration_lock(os.path.join(app.instance_path, 'migrations.lock')):
+        db.create_all()
+        applied = apply_migrations(app.logger)
+        if seed:
+            seed()
+    return applied
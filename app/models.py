@@ -1,12 +1,56 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime, date
+import threading
+import time
+from datetime import datetime, date, timedelta
 
 db = SQLAlchemy()
 
-class User(UserMixin, db.Model):
+# Consultations par mois d'un compte gratuit
+FREE_MONTHLY_USES = 10
+
+class PlanMixin:
+    """
+    État du plan et du quota, calculé en mémoire à partir des colonnes de
+    User (plan, subscription_expires, monthly_uses, last_reset_date).
+    Partagé avec l'identité en cache (app.identity.CachedUser).
+    """
+
+    # Lecture seule : expiration de l'abonnement et remise à zéro mensuelle
+    # sont appliquées en base par User.consume_uses.
+
+    @property
+    def subscription_expired(self):
+        return bool(self.subscription_expires and self.subscription_expires < datetime.utcnow())
+
+    @property
+    def is_premium(self):
+        return self.plan == 'premium' and not self.subscription_expired
+
+    @property
+    def uses_this_month(self):
+        """monthly_uses, ou 0 si le compteur date d'un mois précédent."""
+        if self.last_reset_date is None or self.last_reset_date < _month_start():
+            return 0
+        return self.monthly_uses or 0
+
+    def can_consult(self):
+        return self.is_premium or self.uses_this_month < FREE_MONTHLY_USES
+
+    def remaining_uses(self):
+        if self.is_premium:
+            return '∞'
+        return max(0, FREE_MONTHLY_USES - self.uses_this_month)
+
+
+class User(PlanMixin, UserMixin, db.Model):
     __tablename__ = 'users'
+    __table_args__ = (
+        # Listes admin : comptes non admin, filtrés par plan, triés par inscription
+        db.Index('ix_users_admin_created', 'is_admin', 'created_at'),
+        db.Index('ix_users_plan_created', 'plan', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
@@ -25,52 +69,213 @@ class User(UserMixin, db.Model):
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
 
-    def reset_monthly_uses_if_needed(self):
-        today = date.today()
-        if self.last_reset_date.month != today.month or self.last_reset_date.year != today.year:
-            self.monthly_uses = 0
-            self.last_reset_date = today
-            db.session.commit()
+    def consume_uses(self, count=1):
+        """
+        Décompte `count` consultations en un seul UPDATE conditionnel, qui
+        applique aussi la remise à zéro mensuelle ; un abonnement expiré est
+        d'abord rétrogradé par un UPDATE gardé sur plan = 'premium'.
+        Pour un compte gratuit, refuse (retourne False) si le lot dépasse le
+        quota restant. Ne commit pas : l'appelant valide avec ses insertions.
+        """
+        premium = self.is_premium
+        if self.plan == 'premium' and not premium:
+            # Rétrogradation gardée sur le plan : une seule requête concurrente
+            # (ou expire_subscriptions) la compte
+            downgraded = User.query.filter(User.id == self.id, User.plan == 'premium',
+                                           User.subscription_expires < datetime.utcnow())\
+                .update({User.plan: 'free'}, synchronize_session=False)
+            if downgraded and not self.is_admin:
+                Statistic.increment('premium_users', -downgraded)
+        stale = db.or_(User.last_reset_date.is_(None), User.last_reset_date < _month_start())
+        current = db.case((stale, 0), else_=User.monthly_uses)
+        values = {User.monthly_uses: current + count, User.last_reset_date: date.today()}
+        query = User.query.filter(User.id == self.id)
+        if not premium:
+            query = query.filter(current + count <= FREE_MONTHLY_USES)
+        updated = query.update(values, synchronize_session=False) == 1
+        mark_user_stale(self.id)
+        db.session.expire(self, ['monthly_uses', 'last_reset_date', 'plan'])
+        return updated
 
-    def can_consult(self):
-        self.reset_monthly_uses_if_needed()
-        if self.plan == 'premium':
-            if self.subscription_expires and self.subscription_expires < datetime.utcnow():
-                self.plan = 'free'
-                db.session.commit()
-                return self.monthly_uses < 10
-            return True
-        return self.monthly_uses < 10
+    @staticmethod
+    def expire_subscriptions(now=None):
+        """
+        Rétrograde en gratuit, en un seul UPDATE, tous les abonnements
+        premium expirés ; retourne le nombre de comptes modifiés. Ne commit
+        pas.
+        """
+        rows = db.session.execute(db.update(User)
+            .where(User.plan == 'premium', User.subscription_expires < (now or datetime.utcnow()))
+            .values(plan='free').returning(User.id, User.is_admin)
+            .execution_options(synchronize_session=False)).all()
+        downgraded = sum(1 for _, is_admin in rows if not is_admin)
+        if downgraded:
+            Statistic.increment('premium_users', -downgraded)
+        for user_id, _ in rows:
+            mark_user_stale(user_id)
+        return len(rows)
 
-    def remaining_uses(self):
-        self.reset_monthly_uses_if_needed()
-        if self.plan == 'premium':
-            if self.subscription_expires and self.subscription_expires < datetime.utcnow():
-                self.plan = 'free'
-                db.session.commit()
-                return max(0, 10 - self.monthly_uses)
-            return '∞'
-        return max(0, 10 - self.monthly_uses)
+    @staticmethod
+    def admin_page(plan=None, search=None, since=None, until=None, cursor=None, limit=50):
+        """
+        Comptes non admin, du plus récent au plus ancien, filtrés par plan
+        ('premium' actif, 'expired', 'free'), début du nom ou de l'email et
+        date d'inscription [since, until). Retourne (utilisateurs, curseur
+        suivant ou None) ; ValueError si le curseur est invalide.
+        """
+        query = User.query.filter(User.is_admin == False)
+        now = datetime.utcnow()
+        if plan == 'premium':
+            query = query.filter(User.plan == 'premium',
+                                 db.or_(User.subscription_expires.is_(None), User.subscription_expires >= now))
+        elif plan == 'expired':
+            query = query.filter(User.plan == 'premium', User.subscription_expires < now)
+        elif plan == 'free':
+            query = query.filter(User.plan == 'free')
+        if search:
+            query = query.filter(prefix_filter(search, User.username, User.email))
+        return keyset_page(query, User, cursor, limit, since, until)
+
+
+def mark_user_stale(user_id):
+    """
+    Signale une modification de l'utilisateur faite par UPDATE direct : son
+    identité en cache est supprimée au commit (voir app.identity).
+    """
+    db.session.info.setdefault('stale_users', set()).add(user_id)
+
+
+def _month_start():
+    return date.today().replace(day=1)
 
-    @property
-    def is_premium(self):
-        if self.plan != 'premium':
-            return False
-        if self.subscription_expires and self.subscription_expires < datetime.utcnow():
-            self.plan = 'free'
-            db.session.commit()
-            return False
-        return True
+
+def month_range(day=None):
+    """[début du mois, début du mois suivant) en datetime, pour filtrer created_at sur index."""
+    day = day or date.today()
+    start = datetime(day.year, day.month, 1)
+    end = datetime(day.year + day.month // 12, day.month % 12 + 1, 1)
+    return start, end
+
+
+def prefix_filter(search, *columns):
+    """
+    Colonnes commençant par `search`, en comparaisons de plage utilisables
+    par les index (LIKE 'x%' ne l'est pas sous SQLite sans NOCASE).
+    Sensible à la casse ; une recherche avec « @ » ne porte que sur l'email,
+    comparé en minuscules.
+    """
+    if '@' in search:
+        columns, search = [c for c in columns if c.key == 'email'], search.lower()
+    return db.or_(*(db.and_(column >= search, column < search + '\U0010ffff') for column in columns))
+
+
+def keyset_page(query, model, cursor=None, limit=20, since=None, until=None):
+    """
+    Page de `query`, triée par (created_at, id) décroissants, après `cursor`
+    ("<created_at ISO>_<id>") et restreinte à since <= created_at < until.
+    Retourne (lignes, curseur suivant ou None) ; ValueError si le curseur
+    est invalide.
+    """
+    if since:
+        query = query.filter(model.created_at >= since)
+    if until:
+        query = query.filter(model.created_at < until)
+    if cursor:
+        created_at, _, row_id = cursor.rpartition('_')
+        position = (datetime.fromisoformat(created_at), int(row_id))
+        query = query.filter(db.tuple_(model.created_at, model.id) < position)
+    rows = query.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1).all()
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        return rows[:limit], f"{last.created_at.isoformat()}_{last.id}"
+    return rows, None
 
 
 class Consultation(db.Model):
     __tablename__ = 'consultations'
+    __table_args__ = (
+        # Historique d'un utilisateur : filtre user_id, tri et plage sur created_at
+        db.Index('ix_consultations_user_created', 'user_id', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
     symptoms_text = db.Column(db.Text, nullable=False)
-    results = db.Column(db.Text, nullable=True)      # résumé JSON mots-clés
+    results = db.Column(db.Text, nullable=True)      # ancien résumé JSON, remplacé par diagnoses
     ai_analysis = db.Column(db.Text, nullable=True)   # analyse complète Claude IA
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    diagnoses = db.relationship('ConsultationResult', order_by='ConsultationResult.rank',
+                                lazy=True, cascade='all, delete-orphan')
+
+    @staticmethod
+    def history_page(user_id, cursor=None, limit=20):
+        """
+        Consultations d'un utilisateur, de la plus récente à la plus ancienne,
+        après `cursor` (pagination par clé sur l'index (user_id, created_at)).
+        Retourne (consultations, curseur suivant ou None). ValueError si le
+        curseur est invalide.
+        """
+        query = Consultation.query.filter(Consultation.user_id == user_id)\
+            .options(db.selectinload(Consultation.diagnoses))
+        return keyset_page(query, Consultation, cursor, limit)
+
+    @staticmethod
+    def insert_many(rows):
+        """
+        Insère des consultations et leurs diagnostics en deux requêtes groupées.
+        Chaque ligne : user_id, symptoms_text, created_at (optionnel) et results
+        (résultats de find_diseases). Retourne les ids ; ne commit pas.
+        """
+        now = datetime.utcnow()
+        consultations = [{
+            'user_id': row['user_id'],
+            'symptoms_text': row['symptoms_text'],
+            'created_at': row.get('created_at') or now,
+        } for row in rows]
+        ids = db.session.scalars(
+            db.insert(Consultation).returning(Consultation.id, sort_by_parameter_order=True),
+            consultations).all()
+        diagnoses = [{
+            'consultation_id': consultation_id,
+            'rank': rank,
+            'disease_id': result['id'],
+            'name': result['name'],
+            'confidence': result['confidence'],
+            'score': result['score'],
+            'created_at': consultation['created_at'],
+        } for consultation_id, consultation, row in zip(ids, consultations, rows)
+          for rank, result in enumerate(row['results'], 1)]
+        if diagnoses:
+            db.session.execute(db.insert(ConsultationResult), diagnoses)
+        Statistic.increment('total_consultations', len(ids))
+        return ids
+
+
+class ConsultationResult(db.Model):
+    """Diagnostic proposé lors d'une consultation, par rang (1 = le plus probable)."""
+    __tablename__ = 'consultation_results'
+    __table_args__ = (
+        # Agrégats par période : maladies les plus diagnostiquées
+        db.Index('ix_consultation_results_created_rank_disease', 'created_at', 'rank', 'disease_id'),
+    )
+    consultation_id = db.Column(db.Integer, db.ForeignKey('consultations.id'), primary_key=True)
+    rank = db.Column(db.SmallInteger, primary_key=True)
+    disease_id = db.Column(db.Integer, nullable=True)         # None : maladie absente du catalogue
+    name = db.Column(db.String(200), nullable=False)          # nom au moment de la consultation
+    confidence = db.Column(db.SmallInteger, nullable=False)
+    score = db.Column(db.Float, nullable=True)                # inconnu pour les consultations reprises
+    created_at = db.Column(db.DateTime, nullable=False)       # copie de Consultation.created_at
+
+    @staticmethod
+    def top_diseases(start, end, limit=10, rank=1):
+        """[(disease_id, nombre)] des maladies le plus souvent classées `rank` entre start et end."""
+        count = db.func.count()
+        return db.session.query(ConsultationResult.disease_id, count)\
+            .filter(ConsultationResult.created_at >= start,
+                    ConsultationResult.created_at < end,
+                    ConsultationResult.rank == rank)\
+            .group_by(ConsultationResult.disease_id)\
+            .order_by(count.desc())\
+            .limit(limit).all()
 
 
 class Setting(db.Model):
@@ -82,26 +287,216 @@ class Setting(db.Model):
 
     @staticmethod
     def get(key, default=None):
-        s = Setting.query.filter_by(key=key).first()
-        return s.value if s else default
+        return SETTINGS_CACHE.values().get(key, default)
+
+    @staticmethod
+    def get_many(**defaults):
+        """Plusieurs paramètres d'un coup : Setting.get_many(cle=defaut, ...)."""
+        values = SETTINGS_CACHE.values()
+        return {key: values.get(key, default) for key, default in defaults.items()}
 
     @staticmethod
     def set(key, value):
-        s = Setting.query.filter_by(key=key).first()
-        if s:
-            s.value = str(value)
-            s.updated_at = datetime.utcnow()
-        else:
-            s = Setting(key=key, value=str(value))
-            db.session.add(s)
+        Setting.set_many({key: value})
+
+    @staticmethod
+    def set_many(values):
+        """Enregistre plusieurs paramètres en une transaction."""
+        now = datetime.utcnow()
+        existing = {s.key: s for s in Setting.query.filter(Setting.key.in_(list(values)))}
+        for key, value in values.items():
+            s = existing.get(key)
+            if s:
+                s.value = str(value)
+                s.updated_at = now
+            else:
+                db.session.add(Setting(key=key, value=str(value), updated_at=now))
         db.session.commit()
+        SETTINGS_CACHE.invalidate()
+
+
+class SettingsCache:
+    """
+    Paramètres en mémoire du processus, partagés entre les threads.
+    La version (date de dernière modification, nombre de lignes) est relue
+    au plus toutes les `check_interval` secondes : un Setting.set dans un
+    autre worker gunicorn est donc pris en compte sans redémarrage.
+    """
+
+    def __init__(self, check_interval=5.0):
+        self.check_interval = check_interval
+        self._values = None
+        self._version = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.checks = 0
+        self.reloads = 0
+
+    def values(self):
+        with self._lock:
+            if self._values is not None and time.monotonic() < self._next_check:
+                self.hits += 1
+                return self._values
+        version = tuple(db.session.query(db.func.max(Setting.updated_at), db.func.count(Setting.id)).one())
+        with self._lock:
+            self.checks += 1
+            values = self._values if version == self._version else None
+        if values is None:
+            values = dict(db.session.query(Setting.key, Setting.value).all())
+        with self._lock:
+            if version != self._version or self._values is None:
+                self.reloads += 1
+            self._values, self._version = values, version
+            self._next_check = time.monotonic() + self.check_interval
+        return values
+
+    def invalidate(self):
+        with self._lock:
+            self._values = None
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'checks': self.checks, 'reloads': self.reloads}
+
+
+SETTINGS_CACHE = SettingsCache()
 
 
 class SubscriptionRequest(db.Model):
     __tablename__ = 'subscription_requests'
+    __table_args__ = (
+        # Liste admin par statut et date ; demandes d'un utilisateur
+        db.Index('ix_subscription_requests_status_created', 'status', 'created_at'),
+        db.Index('ix_subscription_requests_created', 'created_at'),
+        db.Index('ix_subscription_requests_user', 'user_id'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     status = db.Column(db.String(20), default='pending')  # pending, approved, rejected
     payment_proof = db.Column(db.String(500), nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     user = db.relationship('User', backref='subscription_requests')
+
+    @staticmethod
+    def admin_page(status=None, search=None, since=None, until=None, cursor=None, limit=50):
+        """
+        Demandes de la plus récente à la plus ancienne, filtrées par statut,
+        début du nom ou de l'email du demandeur et date [since, until),
+        utilisateur chargé dans la même requête. Retourne (demandes, curseur
+        suivant ou None) ; ValueError si le curseur est invalide.
+        """
+        query = SubscriptionRequest.query.options(db.joinedload(SubscriptionRequest.user))
+        if status:
+            query = query.filter(SubscriptionRequest.status == status)
+        if search:
+            query = query.filter(SubscriptionRequest.user_id.in_(
+                db.select(User.id).where(prefix_filter(search, User.username, User.email))))
+        return keyset_page(query, SubscriptionRequest, cursor, limit, since, until)
+
+    @staticmethod
+    def _requesters(ids, status):
+        """(id de la demande, id, plan et rôle du demandeur) des demandes `ids` au statut `status`."""
+        return db.session.query(SubscriptionRequest.id, User.id, User.plan, User.is_admin)\
+            .join(User, SubscriptionRequest.user_id == User.id)\
+            .filter(SubscriptionRequest.id.in_(ids), SubscriptionRequest.status == status).all()
+
+    @staticmethod
+    def approve_many(ids, days):
+        """
+        Approuve les demandes en attente parmi `ids` : chaque demandeur passe
+        premium jusqu'à maintenant + `days` jours. Une lecture et deux UPDATE ;
+        retourne le nombre de demandes approuvées. Ne commit pas.
+        """
+        rows = SubscriptionRequest._requesters(ids, 'pending')
+        if not rows:
+            return 0
+        users = {user_id: (plan, is_admin) for _, user_id, plan, is_admin in rows}
+        approved = db.session.execute(db.update(SubscriptionRequest)
+            .where(SubscriptionRequest.id.in_([row[0] for row in rows]), SubscriptionRequest.status == 'pending')
+            .values(status='approved')).rowcount
+        db.session.execute(db.update(User).where(User.id.in_(users))
+            .values(plan='premium', subscription_expires=datetime.utcnow() + timedelta(days=days)))
+        Statistic.increment('pending_requests', -approved)
+        promoted = sum(1 for plan, is_admin in users.values() if plan != 'premium' and not is_admin)
+        if promoted:
+            Statistic.increment('premium_users', promoted)
+        for user_id in users:
+            mark_user_stale(user_id)
+        return approved
+
+    @staticmethod
+    def reject_many(ids):
+        """Rejette les demandes en attente parmi `ids` en un UPDATE ; retourne leur nombre. Ne commit pas."""
+        rejected = db.session.execute(db.update(SubscriptionRequest)
+            .where(SubscriptionRequest.id.in_(ids), SubscriptionRequest.status == 'pending')
+            .values(status='rejected')).rowcount
+        if rejected:
+            Statistic.increment('pending_requests', -rejected)
+        return rejected
+
+    @staticmethod
+    def extend_many(ids, days):
+        """
+        Prolonge de `days` jours l'abonnement des demandeurs des demandes
+        approuvées parmi `ids`, à partir de l'expiration actuelle si elle
+        est future, sinon de maintenant (le plan redevient premium). Un
+        UPDATE groupé ; retourne le nombre d'utilisateurs prolongés. Ne
+        commit pas.
+        """
+        rows = SubscriptionRequest._requesters(ids, 'approved')
+        users = {user_id: (plan, is_admin) for _, user_id, plan, is_admin in rows}
+        if not users:
+            return 0
+        now = datetime.utcnow()
+        expires = dict(db.session.query(User.id, User.subscription_expires).filter(User.id.in_(users)))
+        db.session.execute(db.update(User), [
+            {'id': user_id, 'plan': 'premium',
+             'subscription_expires': max(expires.get(user_id) or now, now) + timedelta(days=days)}
+            for user_id in users])
+        promoted = sum(1 for plan, is_admin in users.values() if plan != 'premium' and not is_admin)
+        if promoted:
+            Statistic.increment('premium_users', promoted)
+        for user_id in users:
+            mark_user_stale(user_id)
+        return len(users)
+
+
+class Statistic(db.Model):
+    """
+    Compteurs du tableau de bord admin, tenus à jour dans la transaction de
+    chaque écriture concernée (inscription, consultation, abonnement) et
+    recalculés périodiquement par `flask reconcile-stats`.
+    """
+    __tablename__ = 'statistics'
+    name = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @staticmethod
+    def increment(name, delta=1):
+        """UPDATE atomique du compteur dans la transaction en cours ; ne commit pas."""
+        db.session.execute(db.update(Statistic).where(Statistic.name == name)
+                           .values(value=Statistic.value + delta, updated_at=datetime.utcnow()))
+
+    @staticmethod
+    def snapshot():
+        return dict(db.session.query(Statistic.name, Statistic.value).all())
+
+    @staticmethod
+    def reconcile():
+        """Recalcule les compteurs par COUNT(*) ; retourne les écarts corrigés."""
+        actual = {
+            'total_users': User.query.filter_by(is_admin=False).count(),
+            'premium_users': User.query.filter_by(plan='premium', is_admin=False).count(),
+            'total_consultations': Consultation.query.count(),
+            'pending_requests': SubscriptionRequest.query.filter_by(status='pending').count(),
+        }
+        current = Statistic.snapshot()
+        drift = {}
+        for name, value in actual.items():
+            if current.get(name) != value:
+                drift[name] = value - current.get(name, 0)
+                db.session.merge(Statistic(name=name, value=value, updated_at=datetime.utcnow()))
+        db.session.commit()
+        return drift
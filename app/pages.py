@@ -0,0 +1,85 @@
+"""
+Cache des pages rendues : accueil, à propos, encyclopédie, fiches maladie
+et page de limite visiteur.
+
+Ces pages ne dépendent que du catalogue et de l'état de connexion. La page
+complète (base.html compris) est gardée en mémoire du processus, par URL,
+version du catalogue et variante :
+  - visiteur : une seule entrée par URL, partagée par tous les visiteurs
+  - connecté : la barre de navigation affiche nom, plan et quota restant ;
+    l'entrée est propre à cette identité (lue dans USER_CACHE, sans requête)
+    et change dès que le plan ou le quota change
+  - messages flash en attente ou réponse autre que 200 : rendu sans cache
+Chaque entrée porte un ETag (empreinte du corps, identique d'un worker à
+l'autre) et un Last-Modified : un navigateur qui revalide reçoit 304, sans
+rendu ni corps.
+"""
+
+import hashlib
+import threading
+from datetime import datetime, timezone
+from functools import wraps
+
+from flask import current_app, request, session
+from flask_login import current_user
+
+from app.cache import LRUCache
+from app.diseases import get_catalogue
+from app.metrics import METRICS
+
+PAGE_CACHE = LRUCache(maxsize=256)
+
+_lock = threading.Lock()
+_not_modified = 0
+
+
+def page_variant() -> tuple:
+    """Ce qui, de l'utilisateur, apparaît dans la mise en page."""
+    if not current_user.is_authenticated:
+        return ('visiteur',)
+    return ('connecté', current_user.id, current_user.username, current_user.is_admin,
+            current_user.is_premium, current_user.remaining_uses())
+
+
+def cached_page(view):
+    """Sert la vue depuis PAGE_CACHE, avec ETag / Last-Modified et réponses 304."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        global _not_modified
+        if not PAGE_CACHE.enabled or request.method != 'GET' or session.get('_flashes'):
+            return view(*args, **kwargs)
+
+        key = (request.full_path, get_catalogue().version, page_variant())
+        entry = PAGE_CACHE.get(key)
+        if entry is None:
+            with METRICS.timer('page.render'):
+                response = current_app.make_response(view(*args, **kwargs))
+            # Un flash émis par la vue sera lu par la page suivante : pas de mise en cache
+            if response.status_code != 200 or session.get('_flashes'):
+                return response
+            body = response.get_data()
+            entry = (body, hashlib.sha1(body).hexdigest(), response.mimetype,
+                     datetime.now(timezone.utc).replace(microsecond=0))
+            PAGE_CACHE.set(key, entry)
+
+        body, etag, mimetype, last_modified = entry
+        response = current_app.response_class(body, mimetype=mimetype)
+        response.set_etag(etag)
+        response.last_modified = last_modified
+        # Revalidation à chaque affichage ; jamais partagée par un proxy si connecté
+        response.cache_control.no_cache = True
+        if current_user.is_authenticated:
+            response.cache_control.private = True
+        response.vary.add('Cookie')
+        response.make_conditional(request)
+        if response.status_code == 304:
+            with _lock:
+                _not_modified += 1
+        return response
+    return wrapper
+
+
+def stats() -> dict:
+    with _lock:
+        not_modified = _not_modified
+    return dict(PAGE_CACHE.stats(), not_modified=not_modified)
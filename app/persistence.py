@@ -0,0 +1,159 @@
+"""
+Écriture différée (write-behind) des consultations.
+
+La page de résultats n'attend plus le commit SQLite : la consultation est
+mise en file et un thread d'arrière-plan l'insère avec les autres, en une
+seule transaction, dès que `batch_size` lignes sont en attente ou au plus
+tard toutes les `interval` secondes.
+
+  - date de création fixée à la mise en file (ordre de l'historique conservé)
+  - file bornée : au-delà de `max_pending` lignes, l'insertion est faite
+    dans le thread appelant
+  - échec d'une transaction : le lot est réessayé ligne par ligne ; une
+    ligne qui échoue encore est journalisée et abandonnée (comptée dans
+    stats()), sans bloquer les suivantes
+  - arrêt du processus : la file est vidée (atexit)
+Une consultation apparaît dans l'historique au plus `interval` secondes
+après la requête.
+
+Activé par CONSULTATION_WRITE_BEHIND dans la configuration.
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from app.metrics import METRICS
+from app.models import db, Consultation
+
+
+class ConsultationWriter:
+    """File d'insertions de Consultation vidée par lots par un thread de fond."""
+
+    def __init__(self, app, batch_size: int = 50, interval: float = 0.2, max_pending: int = 10000):
+        self.app = app
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_pending = max_pending
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._pid = None
+        self._stopping = False
+        self.flushed = 0
+        self.batches = 0
+        self.errors = 0
+        self.dropped = 0
+        self.sync_writes = 0
+        self.last_flush_ms = 0.0
+        atexit.register(self.shutdown)
+
+    def add(self, **row):
+        """Met une consultation en file (mêmes champs que Consultation.insert_many)."""
+        row.setdefault('created_at', datetime.utcnow())
+        with self._cond:
+            if len(self._pending) < self.max_pending:
+                self._pending.append(row)
+                self._ensure_thread()
+                if len(self._pending) >= self.batch_size:
+                    self._cond.notify()
+                return
+            self.sync_writes += 1
+        self._write([row])
+
+    def _ensure_thread(self):
+        # Thread démarré à la première écriture de chaque processus :
+        # un thread créé avant le fork des workers gunicorn n'y survit pas
+        if self._pid != os.getpid() or not self._thread.is_alive():
+            self._pid = os.getpid()
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name='consultation-writer', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self._pending) >= self.batch_size or self._stopping,
+                                    timeout=self.interval)
+                rows = self._drain()
+                stopping = self._stopping
+            if rows:
+                self._flush(rows)
+            elif stopping:
+                return
+
+    def _drain(self) -> list:
+        rows = list(self._pending)
+        self._pending.clear()
+        return rows
+
+    def _flush(self, rows: list):
+        start = time.perf_counter()
+        try:
+            self._write(rows)
+            written, dropped = len(rows), 0
+        except Exception:
+            self.app.logger.exception('Échec de l\'écriture de %d consultations, reprise ligne par ligne', len(rows))
+            with self._cond:
+                self.errors += 1
+            written, dropped = self._write_each(rows)
+        elapsed = (time.perf_counter() - start) * 1000
+        METRICS.observe('consultation.flush', elapsed)
+        with self._cond:
+            self.flushed += written
+            self.dropped += dropped
+            self.batches += 1
+            self.last_flush_ms = elapsed
+
+    def _write_each(self, rows: list) -> tuple:
+        """Écrit les lignes une à une ; retourne (écrites, abandonnées)."""
+        written = dropped = 0
+        for row in rows:
+            try:
+                self._write([row])
+                written += 1
+            except Exception:
+                dropped += 1
+                self.app.logger.exception('Consultation abandonnée (user_id=%s, créée le %s)',
+                                          row.get('user_id'), row.get('created_at'))
+        return written, dropped
+
+    def _write(self, rows: list):
+        # Contexte d'application propre : session distincte de celle de la requête
+        with self.app.app_context():
+            try:
+                Consultation.insert_many(rows)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+
+    def flush(self):
+        """Insère immédiatement les consultations en attente, dans le thread appelant."""
+        with self._cond:
+            rows = self._drain()
+        if rows:
+            self._flush(rows)
+
+    def shutdown(self, timeout: float = 5.0):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout)
+        self.flush()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                'pending': len(self._pending),
+                'flushed': self.flushed,
+                'batches': self.batches,
+                'errors': self.errors,
+                'dropped': self.dropped,
+                'sync_writes': self.sync_writes,
+                'last_flush_ms': round(self.last_flush_ms, 3),
+            }
@@ -1,6 +1,9 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, current_app
 from flask_login import login_required, current_user
-from app.models import db, User, Consultation, Setting, SubscriptionRequest
+from app.models import db, User, ConsultationResult, Setting, SubscriptionRequest, Statistic, SETTINGS_CACHE, month_range
+from app.metrics import METRICS
+from app.identity import USER_CACHE
+from app import catalogue, diseases, pages
 from functools import wraps
 from datetime import datetime, timedelta
 
@@ -19,21 +22,43 @@ def admin_required(f):
 @login_required
 @admin_required
 def dashboard():
-    total_users = User.query.filter_by(is_admin=False).count()
-    premium_users = User.query.filter_by(plan='premium', is_admin=False).count()
-    total_consultations = Consultation.query.count()
-    pending_requests = SubscriptionRequest.query.filter_by(status='pending').count()
-    price = Setting.get('subscription_price', '5000')
-    payment_info = Setting.get('payment_info', '')
+    # Compteurs incrémentaux (voir Statistic) : pas de COUNT(*) par affichage
+    stats = Statistic.snapshot()
+    settings = Setting.get_many(subscription_price='5000', payment_info='')
+    price, payment_info = settings['subscription_price'], settings['payment_info']
     recent_users = User.query.filter_by(is_admin=False).order_by(User.created_at.desc()).limit(5).all()
+    by_id = diseases.get_catalogue().by_id
+    top_diseases = [(by_id[disease_id].name if disease_id in by_id else 'Maladie retirée du catalogue', count)
+                    for disease_id, count in ConsultationResult.top_diseases(*month_range(), limit=5)]
     return render_template('admin/dashboard.html',
-        total_users=total_users,
-        premium_users=premium_users,
-        total_consultations=total_consultations,
-        pending_requests=pending_requests,
+        total_users=stats.get('total_users', 0),
+        premium_users=stats.get('premium_users', 0),
+        total_consultations=stats.get('total_consultations', 0),
+        pending_requests=stats.get('pending_requests', 0),
         price=price,
         payment_info=payment_info,
-        recent_users=recent_users
+        recent_users=recent_users,
+        top_diseases=top_diseases
+    )
+
+@admin_bp.route('/metrics')
+@login_required
+@admin_required
+def metrics():
+    """Histogrammes de durée par étape et compteurs des caches de ce worker."""
+    if request.args.get('reset') == '1':
+        METRICS.reset()
+    executor = current_app.extensions.get('diagnostic_executor')
+    writer = current_app.extensions.get('consultation_writer')
+    return jsonify(
+        stages=METRICS.snapshot(),
+        result_cache=diseases.RESULT_CACHE.stats(),
+        details_cache=catalogue.DETAILS_CACHE.stats(),
+        executor=executor.stats() if executor else None,
+        consultation_writer=writer.stats() if writer else None,
+        settings_cache=SETTINGS_CACHE.stats(),
+        user_cache=USER_CACHE.stats(),
+        page_cache=pages.stats(),
     )
 
 @admin_bp.route('/settings', methods=['POST'])
@@ -42,31 +67,70 @@ def dashboard():
 def update_settings():
     price = request.form.get('subscription_price', '').strip()
     payment_info = request.form.get('payment_info', '').strip()
+    values = {}
     if price:
-        Setting.set('subscription_price', price)
+        values['subscription_price'] = price
     if payment_info:
-        Setting.set('payment_info', payment_info)
+        values['payment_info'] = payment_info
+    if values:
+        Setting.set_many(values)
     flash('Paramètres mis à jour avec succès.', 'success')
     return redirect(url_for('admin.dashboard'))
 
+def list_filters(**choices):
+    """
+    Filtres d'une liste admin lus dans la requête : q, depuis, jusqu_au
+    (AAAA-MM-JJ) et, pour chaque nom de `choices`, une valeur parmi celles
+    autorisées. Retourne (filtres non vides pour les liens, arguments de
+    admin_page).
+    """
+    filters = {}
+    for name in ('q', 'depuis', 'jusqu_au', *choices):
+        value = request.args.get(name, '').strip()
+        if value and (name not in choices or value in choices[name]):
+            filters[name] = value
+    query = {name: filters.get(name) for name in choices}
+    query['search'] = filters.get('q')
+    for name, arg, days in (('depuis', 'since', 0), ('jusqu_au', 'until', 1)):
+        try:
+            query[arg] = datetime.fromisoformat(filters[name]) + timedelta(days=days) if name in filters else None
+        except ValueError:
+            del filters[name]
+            query[arg] = None
+    return filters, query
+
 @admin_bp.route('/subscriptions')
 @login_required
 @admin_required
 def subscriptions():
-    requests = SubscriptionRequest.query.order_by(SubscriptionRequest.created_at.desc()).all()
-    return render_template('admin/subscriptions.html', requests=requests)
+    filters, query = list_filters(status=('pending', 'approved', 'rejected'))
+    try:
+        requests, next_cursor = SubscriptionRequest.admin_page(**query,
+            cursor=request.args.get('curseur'), limit=current_app.config['ADMIN_PAGE_SIZE'])
+    except ValueError:
+        return redirect(url_for('admin.subscriptions', **filters))
+    return render_template('admin/subscriptions.html', requests=requests,
+        filters=filters, next_cursor=next_cursor, paged='curseur' in request.args,
+        pending_requests=Statistic.snapshot().get('pending_requests', 0))
+
+def duration_arg():
+    """Durée d'abonnement en jours lue dans le formulaire (1 à 365), ou None si absente ou invalide."""
+    duration = request.form.get('duration', type=int)
+    return duration if duration is not None and 1 <= duration <= 365 else None
 
 @admin_bp.route('/subscription/<int:req_id>/approve', methods=['POST'])
 @login_required
 @admin_required
 def approve_subscription(req_id):
     req = SubscriptionRequest.query.get_or_404(req_id)
-    duration = int(request.form.get('duration', 30))  # jours
-    req.status = 'approved'
-    req.user.plan = 'premium'
-    req.user.subscription_expires = datetime.utcnow() + timedelta(days=duration)
-    db.session.commit()
-    flash(f'Abonnement de {req.user.username} approuvé pour {duration} jours.', 'success')
+    duration = duration_arg()
+    if duration is None:
+        flash('Durée invalide (1 à 365 jours).', 'error')
+    elif SubscriptionRequest.approve_many([req.id], duration):
+        db.session.commit()
+        flash(f'Abonnement de {req.user.username} approuvé pour {duration} jours.', 'success')
+    else:
+        flash('Demande déjà traitée.', 'info')
     return redirect(url_for('admin.subscriptions'))
 
 @admin_bp.route('/subscription/<int:req_id>/reject', methods=['POST'])
@@ -74,23 +138,67 @@ def approve_subscription(req_id):
 @admin_required
 def reject_subscription(req_id):
     req = SubscriptionRequest.query.get_or_404(req_id)
-    req.status = 'rejected'
-    db.session.commit()
-    flash(f'Demande de {req.user.username} rejetée.', 'info')
+    if SubscriptionRequest.reject_many([req.id]):
+        db.session.commit()
+        flash(f'Demande de {req.user.username} rejetée.', 'info')
+    else:
+        flash('Demande déjà traitée.', 'info')
     return redirect(url_for('admin.subscriptions'))
 
+def skipped_note(ids, count):
+    skipped = len(set(ids)) - count
+    return f' ; {skipped} déjà traitée(s), ignorée(s)' if skipped else ''
+
+@admin_bp.route('/subscriptions/bulk', methods=['POST'])
+@login_required
+@admin_required
+def bulk_subscriptions():
+    """Approuve, rejette ou prolonge les demandes cochées, en une transaction."""
+    filters, _ = list_filters(status=('pending', 'approved', 'rejected'))
+    ids = request.form.getlist('ids', type=int)
+    action = request.form.get('action')
+    duration = duration_arg()
+    if not ids:
+        flash('Aucune demande sélectionnée.', 'error')
+    elif action in ('approve', 'extend') and duration is None:
+        flash('Durée invalide (1 à 365 jours).', 'error')
+    elif action == 'approve':
+        count = SubscriptionRequest.approve_many(ids, duration)
+        db.session.commit()
+        flash(f'{count} demande(s) approuvée(s) pour {duration} jours{skipped_note(ids, count)}.', 'success')
+    elif action == 'reject':
+        count = SubscriptionRequest.reject_many(ids)
+        db.session.commit()
+        flash(f'{count} demande(s) rejetée(s){skipped_note(ids, count)}.', 'info')
+    elif action == 'extend':
+        count = SubscriptionRequest.extend_many(ids, duration)
+        db.session.commit()
+        flash(f'{count} abonnement(s) prolongé(s) de {duration} jours.', 'success')
+    else:
+        flash('Action inconnue.', 'error')
+    return redirect(url_for('admin.subscriptions', **filters))
+
 @admin_bp.route('/users')
 @login_required
 @admin_required
 def users():
-    all_users = User.query.filter_by(is_admin=False).order_by(User.created_at.desc()).all()
-    return render_template('admin/users.html', users=all_users)
+    filters, query = list_filters(plan=('premium', 'expired', 'free'))
+    try:
+        users, next_cursor = User.admin_page(**query,
+            cursor=request.args.get('curseur'), limit=current_app.config['ADMIN_PAGE_SIZE'])
+    except ValueError:
+        return redirect(url_for('admin.users', **filters))
+    return render_template('admin/users.html', users=users,
+        filters=filters, next_cursor=next_cursor, paged='curseur' in request.args,
+        total_users=Statistic.snapshot().get('total_users', 0))
 
 @admin_bp.route('/user/<int:user_id>/toggle-premium', methods=['POST'])
 @login_required
 @admin_required
 def toggle_premium(user_id):
     user = User.query.get_or_404(user_id)
+    if not user.is_admin:
+        Statistic.increment('premium_users', -1 if user.plan == 'premium' else 1)
     if user.plan == 'premium':
         user.plan = 'free'
         user.subscription_expires = None
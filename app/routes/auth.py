@@ -1,6 +1,6 @@
 from flask import Blueprint, render_template, redirect, url_for, flash, request, session
 from flask_login import login_user, logout_user, login_required, current_user
-from app.models import db, User
+from app.models import db, User, Statistic
 from datetime import datetime
 
 auth_bp = Blueprint('auth', __name__)
@@ -49,6 +49,7 @@ def register():
         user = User(username=username, email=email)
         user.set_password(password)
         db.session.add(user)
+        Statistic.increment('total_users')
         db.session.commit()
         login_user(user, remember=True)
         flash('Compte créé avec succès ! Vous avez 10 consultations par mois.', 'success')
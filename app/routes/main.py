@@ -1,13 +1,18 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, session
+from flask import Blueprint, render_template, redirect, url_for, flash, request, session, jsonify, current_app
 from flask_login import current_user, login_required
-from app.models import db, Consultation, Setting, SubscriptionRequest
-from app.diseases import find_diseases, DISEASES
-import json
-from datetime import datetime, date
+from app.models import db, Consultation, Setting, SubscriptionRequest, Statistic, month_range
+from markupsafe import Markup
+from app.cache import LRUCache
+from app.diseases import find_diseases, find_diseases_batch, get_catalogue, normalize_text
+from app.metrics import METRICS
+from app.pages import cached_page
 
 main_bp = Blueprint('main', __name__)
 GUEST_MAX_USES = 3
 
+# Grille de l'encyclopédie rendue, par (version du catalogue, filtres, page)
+CATALOGUE_PAGES = LRUCache(maxsize=256)
+
 def get_guest_uses():
     return session.get('guest_uses', 0)
 
@@ -16,20 +21,51 @@ def increment_guest_uses():
     session.permanent = True
 
 @main_bp.route('/')
+@cached_page
 def index():
     return render_template('index.html')
 
 @main_bp.route('/a-propos')
+@cached_page
 def a_propos():
     return render_template('a_propos.html')
 
 @main_bp.route('/maladies')
+@cached_page
 def maladies():
-    return render_template('maladies.html', diseases=DISEASES)
+    catalogue = get_catalogue()
+    severity = request.args.get('gravite', '').strip() or None
+    text = request.args.get('symptome', '').strip().lower()
+    symptom = normalize_text(text)
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = current_app.config['CATALOGUE_PAGE_SIZE']
+
+    key = (catalogue.version, severity, text, page, per_page)
+    cached = CATALOGUE_PAGES.get(key)
+    if cached is None:
+        items = catalogue.filter(severity=severity, symptom=symptom, text=text)
+        pages = max(1, -(-len(items) // per_page))
+        page_items = items[(page - 1) * per_page:page * per_page]
+        tiles = render_template('_disease_tiles.html', diseases=page_items)
+        cached = (tiles, len(items), len(page_items), pages)
+        CATALOGUE_PAGES.set(key, cached)
+    tiles, matched, shown, pages = cached
+
+    return render_template('maladies.html', tiles=Markup(tiles),
+        total=len(catalogue.diseases), matched=matched, shown=shown,
+        page=page, pages=pages, severity=severity,
+        symptom=request.args.get('symptome', '').strip(),
+        severity_counts=catalogue.severity_counts)
 
 @main_bp.route('/maladie/<int:disease_id>')
-def maladie_detail(disease_id):
-    disease = next((d for d in DISEASES if d['id'] == disease_id), None)
+@main_bp.route('/maladie/<slug>')
+@cached_page
+def maladie_detail(disease_id=None, slug=None):
+    catalogue = get_catalogue()
+    if slug is not None:
+        disease = catalogue.by_slug.get(slug)
+    else:
+        disease = catalogue.by_id.get(disease_id)
     if not disease:
         flash('Maladie introuvable.', 'error')
         return redirect(url_for('main.maladies'))
@@ -48,37 +84,97 @@ def consulter():
         return redirect(url_for('main.consulter'))
 
     # Vérification des limites
-    if current_user.is_authenticated:
-        if not current_user.can_consult():
-            flash('Limite de consultations atteinte ce mois. Abonnez-vous pour un accès illimité !', 'error')
-            return redirect(url_for('main.abonnement'))
-        current_user.monthly_uses += 1
-        db.session.commit()
-    else:
-        if get_guest_uses() >= GUEST_MAX_USES:
-            return redirect(url_for('main.limit_reached'))
-        increment_guest_uses()
-
-    # Diagnostic par algorithme local
-    results = find_diseases(symptoms)
-
-    # Sauvegarde en base
-    consultation = Consultation(
-        user_id=current_user.id if current_user.is_authenticated else None,
-        symptoms_text=symptoms,
-        results=json.dumps([{
-            "name": r["name"],
-            "confidence": r["confidence"],
-            "severity": r["severity"]
-        } for r in results])
-    )
-    db.session.add(consultation)
+    with METRICS.timer('quota'):
+        if current_user.is_authenticated:
+            # Un seul UPDATE conditionnel : pas de lecture-modification-écriture
+            if not current_user.consume_uses():
+                db.session.rollback()
+                flash('Limite de consultations atteinte ce mois. Abonnez-vous pour un accès illimité !', 'error')
+                return redirect(url_for('main.abonnement'))
+            db.session.commit()
+        else:
+            if get_guest_uses() >= GUEST_MAX_USES:
+                return redirect(url_for('main.limit_reached'))
+            increment_guest_uses()
+
+    # Diagnostic par algorithme local (pool de processus si configuré)
+    executor = current_app.extensions.get('diagnostic_executor')
+    results = find_diseases(symptoms, scorer=executor.score if executor else None)
+
+    # Sauvegarde en base (différée si l'écriture en arrière-plan est active)
+    with METRICS.timer('commit'):
+        row = dict(
+            user_id=current_user.id if current_user.is_authenticated else None,
+            symptoms_text=symptoms,
+            results=results
+        )
+        writer = current_app.extensions.get('consultation_writer')
+        if writer:
+            writer.add(**row)
+        else:
+            Consultation.insert_many([row])
+            db.session.commit()
+
+    with METRICS.timer('render'):
+        return render_template('results.html',
+            symptoms=symptoms,
+            results=results,
+            user=current_user if current_user.is_authenticated else None)
+
+@main_bp.route('/api/diagnostic/batch', methods=['POST'])
+def diagnostic_batch():
+    """
+    Diagnostic par lot (JSON) : {"texts": [...], "top_n": 3}.
+    Le lot est scoré d'abord ; le quota est ensuite décompté pour tout le
+    lot en un seul UPDATE et les consultations insérées dans la même
+    courte transaction.
+    """
+    if not current_user.is_authenticated:
+        return jsonify(error='Authentification requise.'), 401
+
+    payload = request.get_json(silent=True) or {}
+    texts = payload.get('texts')
+    if not isinstance(texts, list) or not texts:
+        return jsonify(error='Le champ "texts" doit être une liste non vide.'), 400
+    max_texts = current_app.config['BATCH_MAX_TEXTS']
+    if len(texts) > max_texts:
+        return jsonify(error=f'Maximum {max_texts} textes par lot.'), 400
+    texts = [t.strip() if isinstance(t, str) else '' for t in texts]
+    invalid = [i for i, t in enumerate(texts) if len(t) < 10]
+    if invalid:
+        return jsonify(error='Textes trop courts (minimum 10 caractères).', invalid=invalid), 400
+    try:
+        top_n = min(max(int(payload.get('top_n', 3)), 1), 10)
+    except (TypeError, ValueError):
+        return jsonify(error='"top_n" doit être un entier.'), 400
+
+    # Refus immédiat d'un lot hors quota, avant le score
+    remaining = current_user.remaining_uses()
+    if remaining != '∞' and remaining < len(texts):
+        return jsonify(error='Quota mensuel insuffisant pour ce lot.', remaining=remaining), 403
+
+    # Score hors transaction : le verrou d'écriture SQLite n'est pris
+    # qu'ensuite, pour le décompte et l'insertion, enchaînés puis validés
+    batch = find_diseases_batch(texts, top_n=top_n)
+
+    if not current_user.consume_uses(len(texts)):
+        db.session.rollback()
+        return jsonify(error='Quota mensuel insuffisant pour ce lot.',
+                       remaining=current_user.remaining_uses()), 403
+    Consultation.insert_many([{
+        'user_id': current_user.id,
+        'symptoms_text': text,
+        'results': results
+    } for text, results in zip(texts, batch)])
     db.session.commit()
 
-    return render_template('results.html',
-        symptoms=symptoms,
-        results=results,
-        user=current_user if current_user.is_authenticated else None)
+    return jsonify(count=len(batch), results=[[{
+        'id': r['id'],
+        'name': r['name'],
+        'confidence': r['confidence'],
+        'severity': r['severity'],
+        'matched_keywords': r['matched_keywords']
+    } for r in results] for results in batch])
 
 @main_bp.route('/dashboard')
 @login_required
@@ -90,18 +186,46 @@ def dashboard():
     return render_template('dashboard.html', user=current_user,
         consultations=consultations, subscription_price=price, total_consultations=total)
 
+def history_items(consultations):
+    """Consultations d'une page d'historique, avec leurs diagnostics par rang."""
+    return [{
+        'id': c.id,
+        'created_at': c.created_at.isoformat(),
+        'date': c.created_at.strftime('%d %B %Y à %H:%M'),
+        'month': c.created_at.strftime('%B %Y'),
+        'symptoms_text': c.symptoms_text,
+        'results': [{'name': d.name, 'confidence': d.confidence} for d in c.diagnoses],
+    } for c in consultations]
+
 @main_bp.route('/historique')
 @login_required
 def historique():
-    consultations = Consultation.query.filter_by(user_id=current_user.id)\
-        .order_by(Consultation.created_at.desc()).all()
-    today = date.today()
+    try:
+        consultations, next_cursor = Consultation.history_page(current_user.id,
+            request.args.get('curseur'), current_app.config['HISTORY_PAGE_SIZE'])
+    except ValueError:
+        return redirect(url_for('main.historique'))
+    total = Consultation.query.filter_by(user_id=current_user.id).count()
+    month_start, month_end = month_range()
     this_month = Consultation.query.filter(
         Consultation.user_id == current_user.id,
-        db.func.strftime('%Y-%m', Consultation.created_at) == today.strftime('%Y-%m')
+        Consultation.created_at >= month_start,
+        Consultation.created_at < month_end
     ).count()
     return render_template('historique.html', user=current_user,
-        consultations=consultations, this_month=this_month)
+        items=history_items(consultations), next_cursor=next_cursor,
+        total=total, this_month=this_month)
+
+@main_bp.route('/api/historique')
+@login_required
+def historique_api():
+    """Page suivante de l'historique (défilement infini) : {"items": [...], "next": curseur}."""
+    try:
+        consultations, next_cursor = Consultation.history_page(current_user.id,
+            request.args.get('curseur'), current_app.config['HISTORY_PAGE_SIZE'])
+    except ValueError:
+        return jsonify(error='Curseur invalide.'), 400
+    return jsonify(items=history_items(consultations), next=next_cursor)
 
 @main_bp.route('/profil')
 @login_required
@@ -132,14 +256,15 @@ def changer_mdp():
 @main_bp.route('/abonnement', methods=['GET', 'POST'])
 @login_required
 def abonnement():
-    price = Setting.get('subscription_price', '5000')
-    payment_info = Setting.get('payment_info', "Contactez l'administrateur.")
+    settings = Setting.get_many(subscription_price='5000', payment_info="Contactez l'administrateur.")
+    price, payment_info = settings['subscription_price'], settings['payment_info']
     pending = SubscriptionRequest.query.filter_by(user_id=current_user.id, status='pending').first()
     if request.method == 'POST':
         if not pending:
             proof = request.form.get('payment_proof', '')
             req = SubscriptionRequest(user_id=current_user.id, payment_proof=proof)
             db.session.add(req)
+            Statistic.increment('pending_requests')
             db.session.commit()
             flash("Demande envoyée ! L'administrateur la validera bientôt.", 'success')
         else:
@@ -148,5 +273,6 @@ def abonnement():
     return render_template('abonnement.html', price=price, payment_info=payment_info, pending=pending)
 
 @main_bp.route('/limite')
+@cached_page
 def limit_reached():
     return render_template('limit_reached.html')
@@ -0,0 +1,123 @@
+"""
+Moteur de score vectorisé (NumPy) — optionnel.
+
+DISEASE_INDEX est compilé en matrices creuses au format COO
+(maladie, terme, poids), triées par maladie puis par champ :
+  - poids    : symptômes-clés 3.0, symptômes communs 1.0, mots-clés legacy 0.8
+  - pénalité : matrice séparée des termes exclusifs
+Une consultation devient un vecteur de niveaux par terme ; scores,
+pénalités, normalisation par max_possible, boost des symptômes-clés et
+sélection du top N sont calculés en opérations sur tableaux.
+Les additions se font dans le même ordre que rank_diseases, le classement
+et les scores sont donc identiques.
+
+Activé par DIAGNOSTIC_ENGINE = "numpy" (nécessite le paquet numpy).
+"""
+
+import numpy as np
+
+from app.diseases import DiseaseIndex, SymptomFeatures, normalize_confidences
+
+
+class VectorizedIndex:
+    """Matrices maladie × terme construites à partir d'un DiseaseIndex."""
+
+    def __init__(self, index: DiseaseIndex):
+        self.entries = index.entries
+        terms = set(index.postings)
+        for entry in self.entries:
+            terms.update(entry.excludes)
+        self.term_ids = {term: i for i, term in enumerate(sorted(terms))}
+
+        rows, cols, weights = [], [], []
+        key_rows, key_cols = [], []
+        exclude_rows, exclude_cols = [], []
+        for i, entry in enumerate(self.entries):
+            for field, weight in ((entry.key_symptoms, 3.0),
+                                  (entry.common_symptoms, 1.0),
+                                  (entry.keywords, 0.8)):
+                for _, term in field:
+                    rows.append(i)
+                    cols.append(self.term_ids[term])
+                    weights.append(weight)
+            for _, term in entry.key_symptoms:
+                key_rows.append(i)
+                key_cols.append(self.term_ids[term])
+            for term in entry.excludes:
+                exclude_rows.append(i)
+                exclude_cols.append(self.term_ids[term])
+
+        self.rows = np.array(rows, dtype=np.intp)
+        self.cols = np.array(cols, dtype=np.intp)
+        self.weights = np.array(weights, dtype=np.float64)
+        self.key_rows = np.array(key_rows, dtype=np.intp)
+        self.key_cols = np.array(key_cols, dtype=np.intp)
+        self.exclude_rows = np.array(exclude_rows, dtype=np.intp)
+        self.exclude_cols = np.array(exclude_cols, dtype=np.intp)
+        self.max_possible = np.array([e.max_possible for e in self.entries], dtype=np.float64)
+        self.key_counts = np.array([max(1, len(e.disease.get("key_symptoms", [])))
+                                    for e in self.entries], dtype=np.float64)
+
+    def level_vector(self, features: SymptomFeatures) -> np.ndarray:
+        levels = np.zeros(len(self.term_ids), dtype=np.float64)
+        for term, level in features.levels.items():
+            tid = self.term_ids.get(term)
+            if tid is not None:
+                levels[tid] = level
+        return levels
+
+    def rank(self, features: SymptomFeatures, top_n: int = 3) -> list:
+        """Même contrat que rank_diseases."""
+        n = len(self.entries)
+        levels = self.level_vector(features)
+
+        # bincount additionne dans l'ordre des postings : même arrondi que la boucle
+        scores = np.bincount(self.rows, weights=self.weights * levels[self.cols], minlength=n)
+        key_hits = np.bincount(self.key_rows, weights=levels[self.key_cols] > 0, minlength=n)
+        excluded = np.bincount(self.exclude_rows, weights=levels[self.exclude_cols] > 0, minlength=n)
+        matched = scores > 0
+
+        scores = scores * 0.5 ** excluded
+        raw = np.zeros(n, dtype=np.float64)
+        np.divide(scores, self.max_possible, out=raw, where=self.max_possible > 0)
+        raw *= 100
+        boosted = key_hits / self.key_counts >= 0.5
+        raw = np.where(boosted, np.minimum(raw * 1.15, 95), raw)
+        confidence = np.minimum(raw.astype(np.int64), 95)
+
+        keep = np.flatnonzero(matched & (confidence >= 5))
+        if not keep.size:
+            return []
+        rounded = np.array([round(float(s), 2) for s in scores[keep]])
+        # Tri stable : score arrondi décroissant, puis ordre du catalogue
+        order = keep[np.lexsort((keep, -rounded))]
+        rounded_by_id = dict(zip(keep.tolist(), rounded.tolist()))
+
+        results = []
+        for i in order[:top_n].tolist():
+            entry = self.entries[i]
+            matched_keywords, matched_key = _matched_lists(entry, features.levels)
+            results.append({
+                **entry.disease,
+                "score": rounded_by_id[i],
+                "confidence": int(confidence[i]),
+                "matched_keywords": matched_keywords[:8],
+                "matched_key_symptoms": matched_key,
+            })
+        normalize_confidences(results)
+        return results
+
+
+def _matched_lists(entry, levels: dict):
+    """Mots-clés trouvés, dans l'ordre d'affichage de rank_diseases."""
+    matched_keywords = []
+    matched_key = []
+    for kw, term in entry.key_symptoms:
+        if levels.get(term, 0.0) > 0:
+            matched_key.append(kw)
+            if kw not in matched_keywords:
+                matched_keywords.append(kw)
+    for kw, term in entry.common_symptoms + entry.keywords:
+        if levels.get(term, 0.0) > 0 and kw not in matched_keywords:
+            matched_keywords.append(kw)
+    return matched_keywords, matched_key
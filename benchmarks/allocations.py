@@ -0,0 +1,52 @@
+"""
+Benchmark d'allocations du pipeline de consultation.
+
+Mesure avec tracemalloc le pic mémoire de chaque étape pour des textes de
+longueur croissante :
+  - extract_features : normalisation + tokenisation, une fois par requête
+  - rank_diseases    : boucle sur les maladies ; ne crée aucune copie du
+                       texte, le pic doit rester constant quand il grandit
+  - partial_match    : boucle de référence (une copie du texte par appel)
+
+Usage : python -m benchmarks.allocations
+"""
+
+import tracemalloc
+
+from app.diseases import DISEASES, extract_features, normalize_text, partial_match, rank_diseases
+
+BASE_TEXT = "J'ai de la fièvre, des frissons et mal de tête depuis trois jours, avec des sueurs la nuit. "
+REPEATS = (1, 10, 100)
+
+
+def reference_loop(normalized: str):
+    """Ancienne boucle : partial_match sur chaque terme de chaque maladie."""
+    for disease in DISEASES:
+        for field in ("key_symptoms", "common_symptoms", "keywords", "excludes"):
+            for kw in disease.get(field, []):
+                partial_match(kw, normalized)
+
+
+def peak_bytes(func, *args):
+    tracemalloc.reset_peak()
+    start, _ = tracemalloc.get_traced_memory()
+    result = func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    return result, peak - start
+
+
+def main():
+    tracemalloc.start()
+    print(f"{'longueur':>9} | {'extract_features':>16} | {'rank_diseases':>13} | {'partial_match':>13}")
+    print("-" * 62)
+    for repeat in REPEATS:
+        text = BASE_TEXT * repeat
+        features, extract_peak = peak_bytes(extract_features, text)
+        _, rank_peak = peak_bytes(rank_diseases, features)
+        _, reference_peak = peak_bytes(reference_loop, normalize_text(text))
+        print(f"{len(text):>9} | {extract_peak:>14} o | {rank_peak:>11} o | {reference_peak:>11} o")
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
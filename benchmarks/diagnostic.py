@@ -0,0 +1,213 @@
+"""
+Benchmark du moteur de diagnostic sur un corpus de symptômes reproductible.
+
+Le corpus est généré à partir des listes de termes de DISEASES avec une
+graine fixe : pour chaque maladie, des descriptions de longueur variable
+mêlant ses mots-clés et symptômes, des expressions courantes (synonymes),
+des fautes de frappe, des majuscules et des mots de liaison. Chaque texte
+garde la maladie dont il est tiré, le même corpus sert donc à la fois :
+  - de mesure de performance : latence par appel (p50/p95/p99), débit,
+    pic mémoire (tracemalloc) et mémoire résidente maximale
+  - de jeu de non-régression : taux top-1 / top-3 par maladie
+
+Le cache de résultats est désactivé pendant la mesure. Les résultats sont
+écrits en JSON pour être comparés d'un commit à l'autre (--compare).
+
+Usage : python -m benchmarks.diagnostic [--engine python] [--per-disease 20]
+                                        [--output bench.json] [--compare ancien.json]
+"""
+
+import argparse
+import json
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from app import diseases
+from app.diseases import DISEASES, SYNONYMS, find_diseases
+
+FILLERS = ("j'ai", "depuis trois jours", "et", "avec", "beaucoup", "la nuit",
+           "mon enfant a", "très", "un peu", "surtout le soir", "ça a commencé hier")
+
+
+def _typo(rng: random.Random, word: str) -> str:
+    if len(word) < 4:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    op = rng.choice("dsit")
+    if op == "d":
+        return word[:i] + word[i + 1:]
+    if op == "s":
+        return word[:i] + rng.choice("aeiourstn") + word[i + 1:]
+    if op == "i":
+        return word[:i] + rng.choice("aeiou") + word[i:]
+    return word[:i - 1] + word[i] + word[i - 1] + word[i + 1:]
+
+
+def build_corpus(per_disease: int = 20, seed: int = 2024) -> list:
+    """[{"text", "disease_id"}] — identique pour une même graine et un même catalogue."""
+    rng = random.Random(seed)
+    expressions = {}  # terme du catalogue → expressions courantes qui s'y ramènent
+    for expression, term in SYNONYMS.items():
+        expressions.setdefault(term.lower(), []).append(expression)
+
+    corpus = []
+    for disease in DISEASES:
+        terms = list(disease["key_symptoms"]) + list(disease["common_symptoms"]) + list(disease["keywords"])
+        if not terms:
+            continue
+        for _ in range(per_disease):
+            parts = []
+            for term in rng.sample(terms, min(len(terms), rng.randint(1, 6))):
+                if term.lower() in expressions and rng.random() < 0.5:
+                    term = rng.choice(expressions[term.lower()])
+                if rng.random() < 0.2:
+                    term = " ".join(_typo(rng, w) for w in term.split())
+                if rng.random() < 0.15:
+                    term = term.upper() if rng.random() < 0.3 else term.capitalize()
+                parts.append(term)
+                if rng.random() < 0.3:
+                    parts.append(rng.choice(FILLERS))
+            corpus.append({
+                "text": rng.choice((" ", ", ", " et ")).join(parts),
+                "disease_id": disease["id"],
+            })
+    return corpus
+
+
+def measure(corpus: list, repeat: int = 1) -> tuple:
+    latencies = []
+    predictions = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        predictions = []
+        for item in corpus:
+            t0 = time.perf_counter()
+            results = find_diseases(item["text"], top_n=3)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            predictions.append([r["id"] for r in results])
+    elapsed = time.perf_counter() - start
+
+    # Passe séparée : tracemalloc ralentit chaque allocation et fausserait la latence
+    tracemalloc.start()
+    for item in corpus:
+        find_diseases(item["text"], top_n=3)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "calls": len(latencies),
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies), 4),
+            "p50": round(quantiles[49], 4),
+            "p95": round(quantiles[94], 4),
+            "p99": round(quantiles[98], 4),
+            "max": round(max(latencies), 4),
+        },
+        "throughput": round(len(latencies) / elapsed, 1),
+        "memory": {
+            "tracemalloc_peak_kb": round(peak / 1024, 1),
+            # ru_maxrss est en Ko sous Linux, en octets sous macOS
+            "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                          // (1024 if sys.platform == "darwin" else 1),
+        },
+    }, predictions
+
+
+def accuracy(corpus: list, predictions: list) -> dict:
+    per_disease = {}
+    for item, predicted in zip(corpus, predictions):
+        stats = per_disease.setdefault(item["disease_id"], {"texts": 0, "top1": 0, "top3": 0})
+        stats["texts"] += 1
+        stats["top1"] += bool(predicted) and predicted[0] == item["disease_id"]
+        stats["top3"] += item["disease_id"] in predicted
+    total = len(corpus) or 1
+    return {
+        "top1": round(sum(s["top1"] for s in per_disease.values()) / total, 4),
+        "top3": round(sum(s["top3"] for s in per_disease.values()) / total, 4),
+        "per_disease": {
+            str(disease_id): {
+                "top1": round(s["top1"] / s["texts"], 4),
+                "top3": round(s["top3"] / s["texts"], 4),
+            }
+            for disease_id, s in per_disease.items()
+        },
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(current: dict, previous: dict):
+    print(f"\nComparaison avec {previous.get('commit') or 'référence'} :")
+    rows = [(f"latence {q}", "ms", current["latency_ms"][q], previous["latency_ms"][q])
+            for q in ("p50", "p95", "p99")]
+    rows.append(("débit", "req/s", current["throughput"], previous["throughput"]))
+    rows.append(("pic mémoire", "Ko", current["memory"]["tracemalloc_peak_kb"],
+                 previous["memory"]["tracemalloc_peak_kb"]))
+    for name in ("top1", "top3"):
+        rows.append((name, "", current["accuracy"][name], previous["accuracy"][name]))
+    for name, unit, now, before in rows:
+        change = f"{(now - before) / before * 100:+.1f} %" if before else "—"
+        print(f"  {name:<13} {before:>10} → {now:<10} {unit:<6} {change}")
+
+    regressions = [
+        disease_id for disease_id, stats in previous["accuracy"]["per_disease"].items()
+        if current["accuracy"]["per_disease"].get(disease_id, {}).get("top3", 0) < stats["top3"]
+    ]
+    if regressions:
+        print(f"  top-3 en baisse pour les maladies : {', '.join(sorted(regressions, key=int))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--engine", default="python", choices=("python", "numpy"))
+    parser.add_argument("--per-disease", type=int, default=20, help="textes générés par maladie")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--repeat", type=int, default=1, help="passes sur le corpus")
+    parser.add_argument("--output", help="fichier JSON des résultats")
+    parser.add_argument("--compare", help="résultats JSON d'un commit précédent")
+    args = parser.parse_args()
+
+    diseases.configure_engine(args.engine, cache_size=0)
+    corpus = build_corpus(args.per_disease, args.seed)
+    perf, predictions = measure(corpus, args.repeat)
+    report = {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "engine": args.engine,
+        "corpus": {"seed": args.seed, "per_disease": args.per_disease,
+                   "texts": len(corpus), "diseases": len(DISEASES)},
+        **perf,
+        "accuracy": accuracy(corpus, predictions),
+    }
+
+    lat = report["latency_ms"]
+    print(f"{len(corpus)} textes × {args.repeat} passe(s), moteur {args.engine}")
+    print(f"  latence  p50 {lat['p50']:.3f} ms | p95 {lat['p95']:.3f} ms | p99 {lat['p99']:.3f} ms")
+    print(f"  débit    {report['throughput']:.1f} req/s")
+    print(f"  mémoire  pic {report['memory']['tracemalloc_peak_kb']} Ko | RSS max {report['memory']['max_rss_kb']} Ko")
+    print(f"  précision top-1 {report['accuracy']['top1']:.2%} | top-3 {report['accuracy']['top3']:.2%}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Résultats écrits dans {args.output}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark de charge : latence des consultations concurrentes avec et sans
+pool de processus de score.
+
+Reproduit un worker gunicorn (--threads 4) : chaque thread enchaîne des
+consultations, dont une sur dix est une longue description riche en mots
+à rechercher en flou. Le cache de résultats est contourné (score_text).
+
+Usage : python -m benchmarks.executor_load [--threads 4] [--requests 50] [--workers 2]
+"""
+
+import argparse
+import random
+import statistics
+import threading
+import time
+
+from app.diseases import DISEASES, normalize_text, score_text
+from app.executor import DiagnosticExecutor
+
+
+def build_texts(count: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    texts = []
+    for i in range(count):
+        disease = rng.choice(DISEASES)
+        words = rng.sample(disease["keywords"], min(4, len(disease["keywords"])))
+        if i % 10 == 0:
+            # Description longue : beaucoup de mots distincts à comparer en flou
+            words += [w + rng.choice("aeiou") for w in rng.choices(disease["symptoms"], k=40)]
+        texts.append(normalize_text(" ".join(words)))
+    return texts
+
+
+def run(scorer, texts: list, threads: int) -> dict:
+    latencies = []
+    lock = threading.Lock()
+    chunks = [texts[i::threads] for i in range(threads)]
+
+    def worker(chunk):
+        local = []
+        for text in chunk:
+            start = time.perf_counter()
+            scorer(text, 3)
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    start = time.perf_counter()
+    pool = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "p50": quantiles[49],
+        "p95": quantiles[94],
+        "p99": quantiles[98],
+        "throughput": len(latencies) / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=50, help="consultations par thread")
+    parser.add_argument("--workers", type=int, default=2, help="processus du pool")
+    args = parser.parse_args()
+
+    texts = build_texts(args.threads * args.requests)
+    executor = DiagnosticExecutor(workers=args.workers, max_pending=args.threads * 2, timeout=30)
+    executor.score(texts[0])  # attendre le démarrage des processus
+
+    print(f"{args.threads} threads × {args.requests} consultations, pool de {args.workers} processus")
+    print(f"{'mode':>8} | {'p50 ms':>8} | {'p95 ms':>8} | {'p99 ms':>8} | {'req/s':>8}")
+    print("-" * 52)
+    for name, scorer in (("inline", score_text), ("pool", executor.score)):
+        r = run(scorer, texts, args.threads)
+        print(f"{name:>8} | {r['p50']:>8.2f} | {r['p95']:>8.2f} | {r['p99']:>8.2f} | {r['throughput']:>8.1f}")
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
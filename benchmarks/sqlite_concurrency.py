@@ -0,0 +1,145 @@
+"""
+Benchmark de concurrence SQLite : débit lectures / écritures avec la
+journalisation par défaut et avec le profil de production (SQLITE_PRAGMAS).
+
+Reproduit plusieurs workers gunicorn partageant un fichier : des processus
+lecteurs enchaînent les requêtes de l'historique (20 dernières consultations
+d'un utilisateur + total), des processus écrivains enchaînent des
+consultations (UPDATE du quota + INSERT, une transaction). Chaque profil
+utilise son propre fichier (le mode WAL est persistant dans la base).
+
+Usage : python -m benchmarks.sqlite_concurrency [--readers 4] [--writers 2] [--seconds 5]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.database import configure_sqlite
+from app.models import db
+from config import Config
+
+USERS = 200
+CONSULTATIONS = 50000
+
+PROFILES = {
+    # Défaut de SQLite (rollback journal, synchronous=FULL) et du pilote sqlite3
+    "défaut": {},
+    "production": Config.SQLITE_PRAGMAS,
+}
+
+
+def make_engine(path: str, pragmas: dict):
+    engine = create_engine(f"sqlite:///{path}")
+    configure_sqlite(engine, pragmas)
+    return engine
+
+
+def seed(path: str, pragmas: dict):
+    engine = make_engine(path, pragmas)
+    db.metadata.create_all(engine)
+    rng = random.Random(7)
+    start = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO users (id, username, email, password_hash, plan, monthly_uses) "
+            "VALUES (:id, :name, :email, 'x', 'premium', 0)"
+        ), [{"id": i, "name": f"u{i}", "email": f"u{i}@bench"} for i in range(1, USERS + 1)])
+        conn.execute(text(
+            "INSERT INTO consultations (user_id, symptoms_text, results, created_at) "
+            "VALUES (:user_id, 'fièvre et toux', '[]', :created_at)"
+        ), [{"user_id": rng.randint(1, USERS), "created_at": start + timedelta(minutes=i)}
+            for i in range(CONSULTATIONS)])
+    engine.dispose()
+
+
+def reader(path: str, pragmas: dict, seconds: float, queue):
+    engine = make_engine(path, pragmas)
+    rng = random.Random(os.getpid())
+    ops = errors = 0
+    deadline = time.perf_counter() + seconds
+    with engine.connect() as conn:
+        while time.perf_counter() < deadline:
+            user_id = rng.randint(1, USERS)
+            try:
+                conn.execute(text(
+                    "SELECT id, created_at FROM consultations WHERE user_id = :u "
+                    "ORDER BY created_at DESC LIMIT 20"), {"u": user_id}).all()
+                conn.execute(text("SELECT count(*) FROM consultations WHERE user_id = :u"),
+                             {"u": user_id}).scalar()
+                conn.rollback()
+                ops += 1
+            except OperationalError:
+                conn.rollback()
+                errors += 1
+    queue.put(("read", ops, errors))
+
+
+def writer(path: str, pragmas: dict, seconds: float, queue):
+    engine = make_engine(path, pragmas)
+    rng = random.Random(os.getpid())
+    ops = errors = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        user_id = rng.randint(1, USERS)
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("UPDATE users SET monthly_uses = monthly_uses + 1 WHERE id = :u"),
+                             {"u": user_id})
+                conn.execute(text(
+                    "INSERT INTO consultations (user_id, symptoms_text, results, created_at) "
+                    "VALUES (:u, 'mal de tête', '[]', :now)"), {"u": user_id, "now": datetime.utcnow()})
+            ops += 1
+        except OperationalError:
+            errors += 1
+    queue.put(("write", ops, errors))
+
+
+def run(path: str, pragmas: dict, readers: int, writers: int, seconds: float) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    procs = [ctx.Process(target=reader, args=(path, pragmas, seconds, queue)) for _ in range(readers)]
+    procs += [ctx.Process(target=writer, args=(path, pragmas, seconds, queue)) for _ in range(writers)]
+    for p in procs:
+        p.start()
+    totals = {"read": [0, 0], "write": [0, 0]}
+    for _ in procs:
+        kind, ops, errors = queue.get()
+        totals[kind][0] += ops
+        totals[kind][1] += errors
+    for p in procs:
+        p.join()
+    return {
+        "reads/s": totals["read"][0] / seconds,
+        "writes/s": totals["write"][0] / seconds,
+        "errors": totals["read"][1] + totals["write"][1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readers", type=int, default=4, help="processus lecteurs")
+    parser.add_argument("--writers", type=int, default=2, help="processus écrivains")
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.readers} lecteurs, {args.writers} écrivains, {args.seconds:g} s par profil")
+    print(f"{'profil':>11} | {'lectures/s':>10} | {'écritures/s':>11} | {'erreurs':>7}")
+    print("-" * 50)
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, pragmas in PROFILES.items():
+            path = os.path.join(tmp, f"{name}.db")
+            seed(path, pragmas)
+            r = run(path, pragmas, args.readers, args.writers, args.seconds)
+            print(f"{name:>11} | {r['reads/s']:>10.1f} | {r['writes/s']:>11.1f} | {r['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,54 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY', 'medisym-secret-key-change-in-production')
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'sqlite:///medisym.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # PRAGMA appliqués à chaque connexion SQLite (valeur vide = défaut de SQLite)
+    SQLITE_PRAGMAS = {
+        'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'WAL'),
+        'synchronous': os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL'),
+        'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 5000)),          # ms
+        'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),   # octets
+        'cache_size': int(os.environ.get('SQLITE_CACHE_SIZE', -32000)),            # négatif = Kio
+    }
+    # Pool de connexions par worker : --threads gunicorn + thread d'écriture différée
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 2))
+    DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', 10))
     PERMANENT_SESSION_LIFETIME = timedelta(days=30)
     GUEST_MAX_USES = 3
     USER_MONTHLY_USES = 10
+    # Moteur de score : 'python' (défaut) ou 'numpy' (nécessite numpy)
+    DIAGNOSTIC_ENGINE = os.environ.get('DIAGNOSTIC_ENGINE', 'python')
+    # Nombre maximum de textes par appel à l'API de diagnostic par lot
+    BATCH_MAX_TEXTS = int(os.environ.get('BATCH_MAX_TEXTS', 500))
+    # Cache LRU des résultats de diagnostic, TTL en secondes (taille ou TTL à 0 = désactivé)
+    RESULT_CACHE_SIZE = int(os.environ.get('RESULT_CACHE_SIZE', 1024))
+    RESULT_CACHE_TTL = int(os.environ.get('RESULT_CACHE_TTL', 3600))
+    # Pool de processus de score (0 = score dans le thread de la requête)
+    DIAGNOSTIC_WORKERS = int(os.environ.get('DIAGNOSTIC_WORKERS', 0))
+    DIAGNOSTIC_QUEUE_SIZE = int(os.environ.get('DIAGNOSTIC_QUEUE_SIZE', 32))
+    DIAGNOSTIC_TIMEOUT = float(os.environ.get('DIAGNOSTIC_TIMEOUT', 5))
+    # Vérification (secondes) des fichiers app/data pour rechargement à chaud (0 = jamais)
+    CATALOGUE_RELOAD_INTERVAL = float(os.environ.get('CATALOGUE_RELOAD_INTERVAL', 30))
+    # Consultations par page de l'historique (puis chargement au défilement)
+    HISTORY_PAGE_SIZE = int(os.environ.get('HISTORY_PAGE_SIZE', 20))
+    # Intervalle (s) de vérification des paramètres modifiés par un autre worker
+    SETTINGS_CHECK_INTERVAL = float(os.environ.get('SETTINGS_CHECK_INTERVAL', 5))
+    # Identité de l'utilisateur connecté en cache, TTL en secondes (taille ou TTL à 0 = un SELECT par requête)
+    USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE', 4096))
+    USER_CACHE_TTL = float(os.environ.get('USER_CACHE_TTL', 30))
+    # Pages rendues en cache (accueil, encyclopédie...), en nombre d'entrées (0 = désactivé)
+    PAGE_CACHE_SIZE = int(os.environ.get('PAGE_CACHE_SIZE', 256))
+    # Lignes par page des listes admin (utilisateurs, demandes d'abonnement)
+    ADMIN_PAGE_SIZE = int(os.environ.get('ADMIN_PAGE_SIZE', 50))
+    # Maladies par page dans l'encyclopédie
+    CATALOGUE_PAGE_SIZE = int(os.environ.get('CATALOGUE_PAGE_SIZE', 60))
+    # Histogrammes de durée par étape (/admin/metrics)
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1') == '1'
+    # Fraction des requêtes profilées avec cProfile (0 = jamais), profils écrits dans PROFILE_DIR
+    PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+    PROFILE_DIR = os.environ.get('PROFILE_DIR', 'profiles')
+    # Écriture différée des consultations : lot de N lignes ou toutes les T secondes
+    CONSULTATION_WRITE_BEHIND = os.environ.get('CONSULTATION_WRITE_BEHIND', '1') == '1'
+    CONSULTATION_FLUSH_SIZE = int(os.environ.get('CONSULTATION_FLUSH_SIZE', 50))
+    CONSULTATION_FLUSH_INTERVAL = float(os.environ.get('CONSULTATION_FLUSH_INTERVAL', 0.2))
+    CONSULTATION_QUEUE_MAX = int(os.environ.get('CONSULTATION_QUEUE_MAX', 10000))
@@ -0,0 +1,19 @@
+"""Application sur une base SQLite temporaire (un fichier par test)."""
+
+import pytest
+
+from app import create_app
+from app.models import db
+from config import Config
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'SQLALCHEMY_DATABASE_URI', f"sqlite:///{tmp_path / 'medisym.db'}")
+    monkeypatch.setattr(Config, 'CONSULTATION_WRITE_BEHIND', False)
+    monkeypatch.setattr(Config, 'CATALOGUE_RELOAD_INTERVAL', 0)
+    app = create_app()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
@@ -0,0 +1,51 @@
+"""Recherche de l'encyclopédie (CatalogueIndex.filter)."""
+
+from app.diseases import get_catalogue, normalize_text
+
+
+def search(query, severity=None):
+    text = query.strip().lower()
+    return [d.name for d in get_catalogue().filter(severity=severity, symptom=normalize_text(text), text=text)]
+
+
+def test_search_matches_name_words_and_prefixes():
+    assert search('influenza') == ['Grippe (Influenza)']
+    assert 'Grippe (Influenza)' in search('Fièv')
+    assert 'Grippe (Influenza)' in search('grip')
+
+
+def test_search_matches_description_and_symptoms():
+    catalogue = get_catalogue()
+    disease = catalogue.diseases[0]
+    description_word = max(disease.search_words - set(disease.name.lower().split()), key=len)
+    assert disease.name in search(description_word)
+    assert disease.name in search(disease.key_symptoms[0])
+
+
+def test_search_combines_words_and_severity():
+    assert search('zzzz') == []
+    results = search('fièvre', severity='urgence')
+    assert results
+    assert all(d.severity == 'urgence' for d in get_catalogue().diseases if d.name in results)
+
+
+def test_details_survive_an_edited_data_file(tmp_path):
+    import json
+
+    from app.catalogue import DISEASES_FILE, load_diseases
+
+    path = tmp_path / 'diseases.jsonl'
+    lines = open(DISEASES_FILE, 'rb').read().splitlines(keepends=True)
+    path.write_bytes(b''.join(lines))
+    diseases = load_diseases(str(path))
+
+    # Description de la première ligne raccourcie : les positions suivantes
+    # tombent au milieu d'une ligne ; la dernière ligne est en cours d'écriture
+    first = json.loads(lines[0])
+    first['description'] = first['description'][1:]
+    lines[0] = (json.dumps(first, ensure_ascii=False) + '\n').encode()
+    path.write_bytes(b''.join(lines) + b'{"id": ')
+
+    expected = {json.loads(line)['id']: json.loads(line)['description'] for line in lines[:4]}
+    for disease in diseases[:4]:
+        assert disease['description'] == expected[disease.id]
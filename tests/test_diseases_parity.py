@@ -0,0 +1,142 @@
+"""
+Parité du moteur indexé avec l'algorithme de référence (partial_match et
+SequenceMatcher appliqués à chaque terme de chaque maladie).
+"""
+
+import random
+import string
+from difflib import SequenceMatcher
+
+from app import diseases
+from app.diseases import (DISEASE_INDEX, FUZZY_THRESHOLD, find_diseases, normalize_confidences,
+                          normalize_text, partial_match)
+
+SEED = 20240517
+LETTERS = string.ascii_lowercase + 'éèàçù'
+
+
+def _mutate(word: str, rng: random.Random) -> str:
+    """Une à deux fautes de frappe : suppression, insertion, substitution ou inversion."""
+    chars = list(word)
+    for _ in range(rng.randint(1, 2)):
+        op = rng.choice('disw')
+        i = rng.randrange(len(chars))
+        if op == 'd' and len(chars) > 1:
+            del chars[i]
+        elif op == 'i':
+            chars.insert(i, rng.choice(LETTERS))
+        elif op == 's':
+            chars[i] = rng.choice(LETTERS)
+        elif op == 'w' and i + 1 < len(chars):
+            chars[i], chars[i + 1] = chars[i + 1], chars[i]
+    return ''.join(chars)
+
+
+def _vocabulary() -> list:
+    return sorted({term for length in DISEASE_INDEX.fuzzy.by_length.values() for term in length})
+
+
+def _words(rng: random.Random) -> list:
+    vocabulary = _vocabulary()
+    words = []
+    for term in vocabulary:
+        words.append(term)
+        words.extend(_mutate(term, rng) for _ in range(3))
+    for _ in range(1000):
+        words.append(''.join(rng.choice(LETTERS) for _ in range(rng.randint(3, 14))))
+    return words
+
+
+def _reference_find_diseases(symptom_text: str, top_n: int) -> list:
+    """Moteur d'origine : chaque terme de chaque maladie comparé au texte par partial_match."""
+    normalized = normalize_text(symptom_text)
+    results = []
+    for disease in diseases.DISEASES:
+        key, common, keywords = disease['key_symptoms'], disease['common_symptoms'], disease['keywords']
+        score = 0.0
+        matched_keywords = []
+        matched_key = []
+        for kw in key:
+            match = partial_match(kw, normalized)
+            if match > 0:
+                score += 3.0 * match
+                matched_key.append(kw)
+                if kw not in matched_keywords:
+                    matched_keywords.append(kw)
+        for kw in common:
+            match = partial_match(kw, normalized)
+            if match > 0:
+                score += 1.0 * match
+                if kw not in matched_keywords:
+                    matched_keywords.append(kw)
+        for kw in keywords:
+            if kw not in key and kw not in common:
+                match = partial_match(kw, normalized)
+                if match > 0:
+                    score += 0.8 * match
+                    if kw not in matched_keywords:
+                        matched_keywords.append(kw)
+        if score == 0:
+            continue
+        for ex in disease['excludes']:
+            if partial_match(ex, normalized) > 0:
+                score *= 0.5
+        max_possible = 3.0 * len(key) + 1.0 * len(common) + 0.8 * max(0, len(keywords) - len(key) - len(common))
+        raw_confidence = (score / max_possible) * 100 if max_possible > 0 else 0
+        if len(matched_key) / max(1, len(key)) >= 0.5:
+            raw_confidence = min(raw_confidence * 1.15, 95)
+        confidence = min(int(raw_confidence), 95)
+        if confidence < 5:
+            continue
+        results.append({**disease, 'score': round(score, 2), 'confidence': confidence,
+                        'matched_keywords': matched_keywords[:8], 'matched_key_symptoms': matched_key})
+    results.sort(key=lambda x: x['score'], reverse=True)
+    normalize_confidences(results)
+    return results[:top_n]
+
+
+def _summary(results: list) -> list:
+    return [(r['id'], r['score'], r['confidence'], list(r['matched_keywords']), list(r['matched_key_symptoms']))
+            for r in results]
+
+
+def _similar(term: str, word: str) -> bool:
+    # real_quick_ratio() et quick_ratio() majorent ratio() : filtre exact
+    matcher = SequenceMatcher(None, term, word)
+    return (matcher.real_quick_ratio() >= FUZZY_THRESHOLD and matcher.quick_ratio() >= FUZZY_THRESHOLD
+            and matcher.ratio() >= FUZZY_THRESHOLD)
+
+
+def test_fuzzy_lookup_matches_sequence_matcher_scan():
+    rng = random.Random(SEED)
+    vocabulary = _vocabulary()
+    mismatches = []
+    for word in _words(rng):
+        expected = {term for term in vocabulary if _similar(term, word)}
+        if DISEASE_INDEX.fuzzy.lookup(word) != expected:
+            mismatches.append(word)
+    assert not mismatches
+
+
+def _texts(rng: random.Random, count: int) -> list:
+    terms = [term for disease in diseases.DISEASES
+             for field in ('key_symptoms', 'common_symptoms', 'keywords', 'excludes')
+             for term in disease[field]]
+    texts = []
+    for _ in range(count):
+        words = []
+        for term in rng.sample(terms, rng.randint(1, 6)):
+            words.extend(_mutate(w, rng) if len(w) > 4 and rng.random() < 0.3 else w for w in term.split())
+        if rng.random() < 0.3:
+            words.append(''.join(rng.choice(LETTERS) for _ in range(rng.randint(4, 10))))
+        texts.append(' '.join(words))
+    return texts
+
+
+def test_find_diseases_matches_partial_match_reference():
+    rng = random.Random(SEED)
+    for text in _texts(rng, 150):
+        # Confiances recalées sur toute la liste avant la coupe : le top 3 est un préfixe du top 10
+        expected = _summary(_reference_find_diseases(text, 10))
+        assert _summary(find_diseases(text, top_n=10)) == expected, text
+        assert _summary(find_diseases(text, top_n=3)) == expected[:3], text
@@ -0,0 +1,56 @@
+"""Reprise des résumés JSON de Consultation.results dans consultation_results."""
+
+import json
+from datetime import datetime
+
+from app import migrations
+from app.diseases import DISEASES
+from app.models import Consultation, ConsultationResult, db
+
+
+def add_consultation(results, created_at=datetime(2024, 3, 1, 9, 30)):
+    consultation = Consultation(symptoms_text='fièvre', results=results, created_at=created_at)
+    db.session.add(consultation)
+    db.session.flush()
+    return consultation.id
+
+
+def stored_results():
+    rows = db.session.query(ConsultationResult.consultation_id, ConsultationResult.rank,
+                            ConsultationResult.disease_id, ConsultationResult.name,
+                            ConsultationResult.confidence, ConsultationResult.created_at)\
+        .order_by(ConsultationResult.consultation_id, ConsultationResult.rank).all()
+    return [tuple(row) for row in rows]
+
+
+def test_backfill_consultation_results(app, monkeypatch):
+    monkeypatch.setattr(migrations, 'BACKFILL_CHUNK', 2)  # plusieurs tranches
+    first, second = DISEASES[0], DISEASES[1]
+    when = datetime(2024, 3, 1, 9, 30)
+    with app.app_context():
+        valid = add_consultation(json.dumps([
+            {'name': first['name'], 'confidence': 80},
+            {'name': 'Maladie retirée du catalogue', 'confidence': '12'},
+        ]))
+        malformed = add_consultation('[{"name": ')
+        not_a_list = add_consultation(json.dumps({'name': first['name']}))
+        empty = add_consultation(None)
+        partial = add_consultation(json.dumps([{'confidence': 5}, {'name': second['name']}]))
+        migrated = add_consultation(json.dumps([{'name': first['name'], 'confidence': 40}]))
+        db.session.add(ConsultationResult(consultation_id=migrated, rank=1, disease_id=second['id'],
+                                          name=second['name'], confidence=55, created_at=when))
+        db.session.commit()
+
+        migrations.backfill_consultation_results()
+        expected = [
+            (valid, 1, first['id'], first['name'], 80, when),
+            (valid, 2, None, 'Maladie retirée du catalogue', 12, when),
+            (partial, 2, second['id'], second['name'], 0, when),
+            (migrated, 1, second['id'], second['name'], 55, when),  # ligne existante conservée
+        ]
+        assert stored_results() == expected
+        assert not {malformed, not_a_list, empty} & {row[0] for row in stored_results()}
+
+        # Deuxième passage : rien à reprendre
+        migrations.backfill_consultation_results()
+        assert stored_results() == expected
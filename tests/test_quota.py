@@ -0,0 +1,100 @@
+"""User.consume_uses : quota mensuel, remise à zéro et rétrogradation, en base."""
+
+import threading
+from datetime import date, datetime, timedelta
+
+from app.models import FREE_MONTHLY_USES, Statistic, User, db
+
+
+def add_user(app, **columns):
+    with app.app_context():
+        user = User(username=columns.pop('username', 'alice'), email='alice@example.com', **columns)
+        user.set_password('secret')
+        db.session.add(user)
+        db.session.commit()
+        return user.id
+
+
+def in_threads(app, count, target):
+    """Lance `target(user)` dans `count` threads, chacun avec sa session, départ simultané."""
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run():
+        try:
+            with app.app_context():
+                barrier.wait()
+                target()
+        except Exception as exc:  # remonté au thread principal
+            errors.append(exc)
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+
+
+def test_concurrent_consultations_stop_at_quota(app):
+    user_id = add_user(app)
+    accepted = []
+
+    def consult():
+        while True:
+            user = db.session.get(User, user_id)
+            ok = user.consume_uses()
+            db.session.commit()
+            if not ok:
+                return
+            accepted.append(1)
+
+    in_threads(app, 8, consult)
+    with app.app_context():
+        assert len(accepted) == FREE_MONTHLY_USES
+        assert db.session.get(User, user_id).monthly_uses == FREE_MONTHLY_USES
+
+
+def test_batch_over_remaining_quota_is_refused(app):
+    user_id = add_user(app, monthly_uses=FREE_MONTHLY_USES - 2, last_reset_date=date.today())
+    with app.app_context():
+        user = db.session.get(User, user_id)
+        assert not user.consume_uses(3)
+        assert user.consume_uses(2)
+        db.session.commit()
+        assert user.monthly_uses == FREE_MONTHLY_USES
+        assert not user.consume_uses()
+
+
+def test_counter_from_previous_month_is_reset(app):
+    last_month = date.today().replace(day=1) - timedelta(days=1)
+    user_id = add_user(app, monthly_uses=FREE_MONTHLY_USES, last_reset_date=last_month)
+    with app.app_context():
+        user = db.session.get(User, user_id)
+        assert user.can_consult()
+        assert user.consume_uses(3)
+        db.session.commit()
+        assert (user.monthly_uses, user.last_reset_date) == (3, date.today())
+
+
+def test_expired_premium_is_downgraded_once(app):
+    user_id = add_user(app, plan='premium', subscription_expires=datetime.utcnow() - timedelta(days=1))
+    with app.app_context():
+        Statistic.increment('premium_users')
+        db.session.commit()
+        before = Statistic.snapshot()['premium_users']
+
+    loaded = threading.Barrier(4)
+
+    def consult():
+        user = db.session.get(User, user_id)
+        loaded.wait()  # chaque session garde une copie encore premium
+        assert user.plan == 'premium'
+        assert user.consume_uses()
+        db.session.commit()
+
+    in_threads(app, 4, consult)
+    with app.app_context():
+        user = db.session.get(User, user_id)
+        assert (user.plan, user.monthly_uses) == ('free', 4)
+        assert Statistic.snapshot()['premium_users'] == before - 1
@@ -0,0 +1,59 @@
+"""
+Réécriture des synonymes en un passage : correspondance la plus à gauche
+puis la plus longue, sans réappliquer les synonymes au texte produit.
+"""
+
+import random
+import time
+
+from app.diseases import SYNONYMS, compile_synonyms, find_diseases, normalize_text
+
+
+def leftmost_longest(text, table):
+    """Référence naïve : à chaque position, la source la plus longue qui commence là."""
+    out, i = [], 0
+    while i < len(text):
+        src = max((s for s in table if s and text.startswith(s, i)), key=len, default=None)
+        if src is None:
+            out.append(text[i])
+            i += 1
+        else:
+            out.append(table[src])
+            i += len(src)
+    return ''.join(out)
+
+
+def test_chains_are_explicit_entries():
+    # « toux sèche avec crachat » est une entrée de synonyms.json
+    assert normalize_text('Toux sèche avec crachat') == 'toux productive'
+    assert normalize_text('toux sèche avec crachat du sang') == 'toux productive du sang'
+    assert find_diseases('toux sèche avec crachat')[0]['name'] == 'Coqueluche'
+
+
+def test_overlapping_sources_leftmost_wins():
+    # « dos qui fait mal » et « mal de tête » se chevauchent : la première l'emporte
+    assert normalize_text('le dos qui fait mal de tête aussi') == 'le douleur dorsale de tête aussi'
+    assert normalize_text('le dos a mal de tête aussi') == 'le dos a maux de tête aussi'
+    table = {'ab': 'X', 'bc': 'Y', 'abcd': 'Z'}
+    pattern = compile_synonyms(table)
+    assert pattern.sub(lambda m: table[m.group(0)], 'abc abcd bcd') == 'Xc Z Yd'
+
+
+def test_single_pass_is_leftmost_longest():
+    rng = random.Random(20240517)
+    pieces = list(SYNONYMS) + list(SYNONYMS.values()) + ['avec', 'crachat', 'du sang', 'la nuit', 'toux', 'e', 's', ' ']
+    for _ in range(2000):
+        text = rng.choice(['', ' ']).join(rng.choice(pieces) for _ in range(rng.randint(1, 5))).strip()
+        assert normalize_text(text) == leftmost_longest(text, SYNONYMS), text
+
+
+def test_compile_scales_with_table_size():
+    rng = random.Random(7)
+    words = ['mal', 'de', 'tête', 'dos', 'qui', 'fait', 'toux', 'avec', 'crachat', 'fièvre', 'nuit', 'ventre']
+    table = {' '.join(rng.choice(words) for _ in range(rng.randint(2, 5))) + f' {i}': f'terme {i}'
+             for i in range(2000)}
+    start = time.perf_counter()
+    pattern = compile_synonyms(table)
+    assert time.perf_counter() - start < 2
+    src = next(iter(table))
+    assert pattern.sub(lambda m: table[m.group(0)], f'x {src} y') == f'x {table[src]} y'